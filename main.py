@@ -1,5 +1,7 @@
 import streamlit as st
 
+from utils.prewarm import show_progress, start_prewarm
+
 # 페이지 설정
 st.set_page_config(
     page_title="SDGs 데이터 탐구",
@@ -37,5 +39,5 @@ st.markdown("""
 👉 왼쪽 메뉴에서 시작할 내용을 선택해보세요!
 """)
 
-
-
+# 학생이 안내문을 읽는 동안 각 페이지의 데이터 · 기본 차트를 백그라운드에서 준비
+show_progress(start_prewarm())
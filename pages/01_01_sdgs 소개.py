@@ -2,7 +2,8 @@
 
 # -*- coding: utf-8 -*-
 import streamlit as st
-import os
+
+from utils.assets import icon_set
 
 # 🔽 외부 파일에서 가져오지 말고, 여기 직접 SDGS 정의
 SDGS = [
@@ -139,6 +140,10 @@ UN은 2015년, 193개 회원국과 함께 **2030년까지 달성해야 할 17가
 """)
 
 
+# 아이콘 17장은 표시 크기(100px)로 한 번만 줄여 둠 (rerun 마다 파일 확인 · 다시 인코딩 없음)
+ICON_WIDTH = 100
+icons = icon_set(tuple(f"images/sdg{sdg['id']}.png" for sdg in SDGS), ICON_WIDTH)
+
 # 3개씩 묶어서 한 줄씩 배치
 for i in range(0, len(SDGS), 3):
     cols = st.columns(3)
@@ -148,10 +153,11 @@ for i in range(0, len(SDGS), 3):
             with cols[j]:
                 with st.expander(f"🎯 {sdg['id']}. {sdg['title']}"):
                     image_path = f"images/sdg{sdg['id']}.png"
+                    image = icons.get(image_path)       # 프로젝트 폴더 또는 데이터 번들에서 읽어 둔 것
 
                     # 이미지가 존재하면 출력하고, 없어도 텍스트는 출력되도록!
-                    if os.path.exists(image_path):
-                        st.image(image_path, width=100)
+                    if image is not None:
+                        st.image(image, width=ICON_WIDTH)
                     else:
                         st.write(f"🖼 이미지 없음 (경로: `{image_path}`)")
 
@@ -1,196 +1,189 @@
 # pages/2_📊_PM10_시각화.py
 import streamlit as st
-import pandas as pd
-import altair as alt
-import pydeck as pdk
+import numpy as np
 from pathlib import Path
 
+from utils.classify import PM10_GRADES
+from utils.data import available, load_csv, load_upload
+from utils.figcache import cached_figure
+from utils.geo import GAZETTEERS, attach_coords
+from utils.profiling import page_profiler
+from utils.tidy import tidy_view, tidy_view_of_frame
+
 # ────────────────────────────────────────────────────────────
 # 0. 페이지 설정
 # ────────────────────────────────────────────────────────────
 st.set_page_config(page_title="PM10 시각화", page_icon="🌫️", layout="wide")
-st.title("📊 월별‧도시별 미세먼지(PM10) 데이터 탐구")
+with page_profiler():
+    st.title("📊 월별‧도시별 미세먼지(PM10) 데이터 탐구")
 
-# ────────────────────────────────────────────────────────────
-# 1. CSV 로드 함수 (다중 인코딩 시도)
-# ────────────────────────────────────────────────────────────
-@st.cache_data
-def try_read_csv(path_or_file):
-    encodings = ["utf-8", "utf-8-sig", "cp949", "euc-kr"]
-    for enc in encodings:
+    # ────────────────────────────────────────────────────────────
+    # 1. CSV 로드 함수 (인코딩 자동 감지 → 한 번만 파싱)
+    # ────────────────────────────────────────────────────────────
+    def try_read_csv(path_or_file):
         try:
-            df = pd.read_csv(path_or_file, encoding=enc)
-            st.success(f"✅ CSV 파일을 불러왔습니다 (encoding='{enc}')")
-            return df
-        except UnicodeDecodeError:
-            continue
-    st.error("❌ 파일 인코딩을 감지하지 못했습니다.")
-    return None
-
-# ────────────────────────────────────────────────────────────
-# 2. CSV 확보 (로컬 파일 또는 업로드)
-# ────────────────────────────────────────────────────────────
-DATA_PATH = Path(__file__).parent / "미세먼지_PM10__월별_도시별_대기오염도.csv"
-
-if DATA_PATH.exists():
-    df_wide = try_read_csv(DATA_PATH)
-else:
-    uploaded = st.file_uploader("📤 CSV 파일 업로드", type=["csv"])
-    if uploaded:
-        df_wide = try_read_csv(uploaded)
+            if isinstance(path_or_file, Path):
+                return load_csv(path_or_file)
+            return load_upload(path_or_file)
+        except UnicodeError:               # 감지 실패 · UnicodeDecodeError
+            st.error("❌ 파일 인코딩을 감지하지 못했습니다.")
+            return None
+
+    # ────────────────────────────────────────────────────────────
+    # 2. CSV 확보 (로컬 파일 또는 업로드)
+    # ────────────────────────────────────────────────────────────
+    DATA_PATH = Path(__file__).parent / "미세먼지_PM10__월별_도시별_대기오염도.csv"
+
+    if available(DATA_PATH):
+        df_wide = try_read_csv(DATA_PATH)
     else:
-        st.stop()          # 파일 없으면 이후 코드 중단
-
-if df_wide is None:
-    st.stop()
-
-# ────────────────────────────────────────────────────────────
-# 3. 데이터 전처리 (wide → long)
-# ────────────────────────────────────────────────────────────
-try:
-    df_long = df_wide.melt(
-        id_vars=[df_wide.columns[0]],           # 첫 열 → 지역
-        var_name="월",
-        value_name="PM10"
-    ).rename(columns={df_wide.columns[0]: "지역"})
-
-    # 월을 날짜형으로 변환해 정렬용 컬럼 추가
-    df_long["순서"] = pd.to_datetime(df_long["월"], format="%Y년%m월", errors="coerce")
-except Exception as e:
-    st.error("📛 데이터 변환 오류: " + str(e))
-    st.stop()
+        uploaded = st.file_uploader("📤 CSV 파일 업로드", type=["csv"])
+        if uploaded:
+            df_wide = try_read_csv(uploaded)
+        else:
+            st.stop()          # 파일 없으면 이후 코드 중단
+
+    if df_wide is None:
+        st.stop()
+
+    # 감지한 인코딩 안내는 캐시 밖에서 (캐시 재생 시 UI 가 중복되지 않도록)
+    st.success(f"✅ CSV 파일을 불러왔습니다 (encoding='{df_wide.attrs.get('encoding')}')")
+
+    # ────────────────────────────────────────────────────────────
+    # 3. 데이터 전처리 (wide → long)
+    # ────────────────────────────────────────────────────────────
+    # 파일 버전마다 한 번만 변환해 두고 재사용 (첫 열 → 지역)
+    try:
+        tidy_args = dict(var_name="월", value_name="PM10", id_name="지역")
+        if available(DATA_PATH):
+            view = tidy_view(DATA_PATH, **tidy_args)
+        else:
+            view = tidy_view_of_frame(df_wide, **tidy_args)
+        df_long = view.long
+    except Exception as e:
+        st.error("📛 데이터 변환 오류: " + str(e))
+        st.stop()
+
+    # ────────────────────────────────────────────────────────────
+    # 4. 데이터 미리보기
+    # ────────────────────────────────────────────────────────────
+    with st.expander("🔍 원본 데이터 미리보기", expanded=False):
+        st.dataframe(df_wide.head())
+
+    # ────────────────────────────────────────────────────────────
+    # 5. Altair 선 그래프 (도시별 월간 추세)
+    # ────────────────────────────────────────────────────────────
+    st.subheader("① 도시별 월간 추세 (선 그래프)")
+
+    city_options = list(view.ids)
+    default_city = "서울특별시" if "서울특별시" in city_options else city_options[0]
+    st.caption("범례에서 도시를 누르면 그 도시만, Shift+클릭으로 여러 도시를 함께 봅니다. (빈 곳을 더블클릭하면 전체)")
+
+    def build_city_trend(city):
+        import altair as alt
+        # 모든 도시를 한 번에 보내고, 범례 클릭(selection param)으로 브라우저에서 강조
+        #  ▸ 고르지 않은 도시는 흐리게 남겨 두어 범례 · 비교 맥락이 유지됨
+        pick = alt.selection_point(name="city", fields=["지역"], bind="legend", value=[{"지역": city}])
+
+        # 정렬 기준 리스트 (월 열은 원본 열 순서 = 시간 순서를 기억하는 범주형)
+        month_order = view.variables
+
+        return (
+            alt.Chart(view.long)
+            .mark_line(point=True)
+            .encode(
+                x=alt.X("월:N", sort=month_order, title="연‧월"),
+                y=alt.Y("PM10:Q", title="PM10 농도(㎍/㎥)"),
+                color="지역:N",
+                opacity=alt.condition(pick, alt.value(1.0), alt.value(0.08)),
+                tooltip=["지역", "월", "PM10"]
+            )
+            .add_params(pick)
+            .properties(height=400)
+        )
 
-# ────────────────────────────────────────────────────────────
-# 4. 데이터 미리보기
-# ────────────────────────────────────────────────────────────
-with st.expander("🔍 원본 데이터 미리보기", expanded=False):
-    st.dataframe(df_wide.head())
+    line_chart = cached_figure("pm10.city_trend", [DATA_PATH], build_city_trend, city=default_city)
+    st.altair_chart(line_chart, use_container_width=True)
 
-# ────────────────────────────────────────────────────────────
-# 5. Altair 선 그래프 (도시별 월간 추세)
-# ────────────────────────────────────────────────────────────
-st.subheader("① 도시별 월간 추세 (선 그래프)")
-
-city_options = df_long["지역"].unique().tolist()
-sel_cities = st.multiselect(
-    "도시(복수 선택 가능)",
-    city_options,
-    default=["서울특별시"]
-)
-
-if sel_cities:
-    chart_data = df_long[df_long["지역"].isin(sel_cities)]
-    
-    # 정렬 기준 리스트 (문자열 순서)
-    month_order = (
-        chart_data.sort_values("순서")["월"]
-        .dropna()
-        .unique()
-        .tolist()
-    )
-
-    line_chart = (
-        alt.Chart(chart_data)
-        .mark_line(point=True)
-        .encode(
-            x=alt.X("월:N", sort=month_order, title="연‧월"),
-            y=alt.Y("PM10:Q", title="PM10 농도(㎍/㎥)"),
-            color="지역:N",
-            tooltip=["지역", "월", "PM10"]
+    # ────────────────────────────────────────────────────────────
+    # 6. 월별 지도 (모든 월을 한 번에 보내고, 월 이동은 브라우저에서)
+    # ────────────────────────────────────────────────────────────
+    st.subheader("② 월별 지도 시각화")
+    st.caption("지도 아래 슬라이더를 움직이거나 ▶ 를 누르면 월이 바뀝니다. (서버를 다시 실행하지 않음)")
+
+    def build_month_map():
+        import plotly.graph_objects as go
+        # 지도 데이터
+        #  ▸ 좌표는 공용 지명 사전(gazetteer_kr_regions.csv)에서 한 번에 붙이고 (좌표 없는 지역은 제외)
+        #  ▸ 등급 · 색상은 경계값 표(PM10_GRADES)로 모든 월 × 지역을 한 번에 분류
+        #  ▸ 위치 · 이름은 한 번만 넣고, 월마다(frame)는 크기 · 색 · 등급만 보냄
+        months = view.variables
+        map_df = attach_coords(view.wide, "지역", "kr_region").dropna(subset=["lat", "lon"])
+        pm = map_df[months].to_numpy(dtype="float64")            # 지역 × 월
+        grade_idx = PM10_GRADES.grade_index(pm.ravel()).reshape(pm.shape)
+        labels = PM10_GRADES.labels_for_index(grade_idx)
+        values = np.where(np.isnan(pm), "-", np.nan_to_num(pm).round().astype("int64").astype(str))
+        sizes = np.nan_to_num(pm)
+
+        # 색은 문자열 대신 등급 번호(-1 = 정보없음) + 계단형 색 척도로 보냄 (frame 이 가벼워짐)
+        palette = [PM10_GRADES.missing_color, *PM10_GRADES.colors]
+        colorscale = []
+        for k, (r, g, b, a) in enumerate(palette):
+            color = f"rgba({r},{g},{b},{a / 255:.2f})"
+            colorscale += [[k / len(palette), color], [(k + 1) / len(palette), color]]
+
+        def month_marker(j):
+            return dict(
+                marker=dict(size=sizes[:, j], color=grade_idx[:, j]),
+                customdata=np.stack([values[:, j], labels[:, j]], axis=1),
+            )
+
+        last = len(months) - 1
+        fig = go.Figure(
+            go.Scattergeo(
+                lat=map_df["lat"], lon=map_df["lon"], text=map_df["지역"], mode="markers",
+                hovertemplate="%{text}<br>PM10: %{customdata[0]} ㎍/㎥<br>등급: %{customdata[1]}<extra></extra>",
+                **month_marker(last),
+            ),
+            frames=[go.Frame(name=month, data=[go.Scattergeo(**month_marker(j))]) for j, month in enumerate(months)],
         )
-        .properties(height=400)
-    )
-    st.altair_chart(line_chart, use_container_width=True)
-else:
-    st.info("좌측 체크박스에서 한 개 이상 도시를 선택하세요.")
+        # 원 크기(면적) 기준은 모든 월에 공통 → 월을 바꿔도 같은 농도는 같은 크기
+        fig.update_traces(marker=dict(
+            sizemode="area", sizeref=2 * max(sizes.max(), 1) / 40**2, sizemin=2,
+            colorscale=colorscale, cmin=-1, cmax=len(PM10_GRADES.labels) - 1,
+        ))
+        animate = dict(mode="immediate", frame=dict(duration=0, redraw=True), transition=dict(duration=0))
+        fig.update_layout(
+            height=550,
+            margin=dict(l=0, r=0, t=10, b=0),
+            geo=dict(
+                fitbounds="locations", resolution=50, projection_type="mercator",
+                showland=True, landcolor="rgb(240,240,240)", showcountries=True,
+            ),
+            sliders=[dict(
+                active=last,
+                currentvalue=dict(prefix="월: "),
+                steps=[dict(method="animate", label=month, args=[[month], animate]) for month in months],
+            )],
+            updatemenus=[dict(
+                type="buttons", direction="left", x=0, y=0, xanchor="right", yanchor="top",
+                buttons=[
+                    dict(label="▶", method="animate",
+                         args=[None, dict(animate, frame=dict(duration=700, redraw=True), fromcurrent=True)]),
+                    dict(label="⏸", method="animate", args=[[None], animate]),
+                ],
+            )],
+        )
+        return fig
 
-# ────────────────────────────────────────────────────────────
-# 6. 월 선택 → pydeck 지도 (PM10 색상 매핑)
-# ────────────────────────────────────────────────────────────
-st.subheader("② 선택 월 지도 시각화")
-def pm10_level(value):
-    if value <= 30:
-        return "좋음"
-    elif value <= 80:
-        return "보통"
-    elif value <= 150:
-        return "나쁨"
-    else:
-        return "매우나쁨"
-        
-month_cols = [c for c in df_wide.columns if c != "지역"]
-sel_month = st.selectbox("보고 싶은 월", month_cols, index=len(month_cols) - 1)
-
-# (1) 좌표 사전
-city_coords = {
-    "서울특별시": (37.5665, 126.9780), "부산광역시": (35.1796, 129.0756),
-    "대구광역시": (35.8714, 128.6014), "인천광역시": (37.4563, 126.7052),
-    "광주광역시": (35.1595, 126.8526), "대전광역시": (36.3504, 127.3845),
-    "울산광역시": (35.5384, 129.3114), "세종특별자치시": (36.4800, 127.2890),
-    "경기도": (37.4133, 127.5183),   "강원특별자치도": (37.8228, 128.1555),
-    "충청북도": (36.6358, 127.4914), "전북특별자치도": (35.8200, 127.1088),
-    "전라남도": (34.8160, 126.4630), "경상북도": (36.4919, 128.8889),
-    "경상남도": (35.4606, 128.2132), "제주특별자치도": (33.4996, 126.5312),
-}
-
-# (2) 색상 변환 함수  ▸ 낮음=녹색, 보통=노랑, 높음=빨강
-def pm_to_color(pm):
-    if pd.isna(pm):
-        return [200, 200, 200, 160]        # 회색
-    if pm <= 30:
-        return [0, 200, 0, 160]            # 녹색
-    elif pm <= 80:
-        return [255, 215, 0, 160]          # 노랑
-    else:
-        return [255, 0, 0, 160]            # 빨강
-
-# 색상 매핑 함수
-def pm10_color(level):
-    return {
-        "좋음": [0, 128, 255, 160],
-        "보통": [0, 200, 0, 160],
-        "나쁨": [255, 165, 0, 160],
-        "매우나쁨": [255, 0, 0, 160]
-    }[level]
-    
-# (3) 지도 데이터 프레임
-map_df = (
-    df_wide[["지역", sel_month]]
-    .assign(
-        lat=lambda d: d["지역"].map(lambda x: city_coords.get(x, (0, 0))[0]),
-        lon=lambda d: d["지역"].map(lambda x: city_coords.get(x, (0, 0))[1]),
-        pm=lambda d: d[sel_month],
-        등급=lambda d: d[sel_month].apply(pm10_level),
-    )
-)
-
-map_df["radius"] = map_df["pm"] * 500
-map_df["color"] = map_df["등급"].apply(pm10_color)
-
-# Pydeck Layer
-layer = pdk.Layer(
-    "ScatterplotLayer",
-    data=map_df,
-    get_position="[lon, lat]",
-    get_radius="radius",
-    get_fill_color="color",
-    pickable=True,
-    auto_highlight=True,
-)
-
-view_state = pdk.ViewState(latitude=36.5, longitude=127.8, zoom=5.5)
-
-st.pydeck_chart(pdk.Deck(
-    layers=[layer],
-    initial_view_state=view_state,
-    tooltip={"text": "{지역}\nPM10: {pm} ㎍/㎥\n등급: {등급}"}
-))
-
-# -------------------------------
-# 시각화 범례 설명
-st.markdown("---")
-st.markdown("#### 🧭 시각화 정보")
-st.markdown("""
+    fig_map = cached_figure("pm10.month_map", [DATA_PATH, GAZETTEERS["kr_region"]["file"]], build_month_map)
+    st.plotly_chart(fig_map, use_container_width=True)
+
+    # -------------------------------
+    # 시각화 범례 설명
+    st.markdown("---")
+    st.markdown("#### 🧭 시각화 정보")
+    st.markdown("""
 - **원의 크기**: PM10 농도(㎍/㎥)에 비례  
 - **원의 색상**:
     - 🔵 **좋음 (0~30)**
@@ -198,26 +191,26 @@ st.markdown("""
     - 🟠 **나쁨 (81~150)**
     - 🔴 **매우나쁨 (151 이상)**
 """)
-# ────────────────────────────────────────────────────────────
-# 7. 토론 질문 · 교육적 함의 · 확장 활동
-# ────────────────────────────────────────────────────────────
-st.markdown("---")
-st.subheader("🗣️ 학생 토론 질문")
-st.markdown("""
+    # ────────────────────────────────────────────────────────────
+    # 7. 토론 질문 · 교육적 함의 · 확장 활동
+    # ────────────────────────────────────────────────────────────
+    st.markdown("---")
+    st.subheader("🗣️ 학생 토론 질문")
+    st.markdown("""
 1. **도시별·계절별로 PM10 농도가 달라지는 주된 요인은 무엇일까요?**  
 2. **SDGs 목표 11 ‘지속가능한 도시와 공동체’** 달성을 위해, 각 도시가 시행할 수 있는 대기질 개선 정책은 무엇이 있을까요?  
 3. **여러분 지역**의 체감 공기 질과 데이터가 다른 부분이 있다면, 왜 그런지 가설을 세워보세요.
 """)
 
-st.subheader("🎓 교육적 함의")
-st.markdown("""
+    st.subheader("🎓 교육적 함의")
+    st.markdown("""
 - **데이터 해석 역량**: 시계열·공간 데이터를 함께 분석하여 패턴과 상관관계 파악  
 - **과학·사회 융합**: 기상·산업·교통 요인과 연계해 과학적 근거 기반 정책 제안  
 - **SDGs 연결**: 대기오염이 건강(Goal 3), 기후(Goal 13)와 밀접히 관련됨을 이해
 """)
 
-st.subheader("🚀 확장 활동")
-st.markdown("""
+    st.subheader("🚀 확장 활동")
+    st.markdown("""
 - **기상 데이터(기온·풍속 등)** 추가 후 다중 회귀 분석으로 PM10 예측 모델 만들기  
 - **다른 대기오염물질(PM2.5·NO₂ 등)**로 지표 확장 → SDGs Goal 3·13 심화 탐구  
 - **현장 중심 프로젝트**: 시청·의회에 대기 개선 정책 인포그래픽 또는 제안서 제출
@@ -1,99 +1,164 @@
 import streamlit as st
-import pandas as pd
-import plotly.express as px
-import numpy as np
 
-# 데이터 불러오기
-file_path = "sealevel_data_download.csv"
-df = pd.read_csv(file_path)
+from utils.decimate import decimate_frame
+from utils.figcache import cached_figure
+from utils.fragment import fragment
+from utils.profiling import page_profiler
+from utils.sealevel import (
+    GMSL_FILE, MIN_COVERAGE, SEALEVEL_FILE,
+    global_trend, gmsl_series, station_store, station_trends,
+)
+
+GMSL_WIDTH_PX = 1200        # GMSL 차트 폭 (wide 레이아웃의 전체 폭 차트, 솎아내기 기준)
 
 # 페이지 설정
 st.set_page_config(page_title="📈 해수면 상승과 SDGs", layout="wide")
-st.title("📈 해수면 상승과 지속가능발전목표(SDGs)")
-
-# -------------------
-# 1️⃣ 연도별 해수면 평균 변화 추이
-# -------------------
-year_columns = [col for col in df.columns if col.isnumeric()]
-df_yearly = df[year_columns].mean().reset_index()
-df_yearly.columns = ["Year", "Avg_Sea_Level"]
-df_yearly["Year"] = df_yearly["Year"].astype(int)
-
-st.markdown("### 🌊 전 세계 평균 해수면 변화 추이")
-fig_line = px.line(df_yearly, x="Year", y="Avg_Sea_Level", markers=True,
-                   labels={"Avg_Sea_Level": "해수면(mm)"},
-                   title="연도별 평균 해수면 변화")
-fig_line.update_layout(title_font_size=18)
-st.plotly_chart(fig_line, use_container_width=True)
-
-# -------------------
-# 2️⃣ 해수면 상승량 상위 지역
-# -------------------
-
-df["Change_1978_2018"] = df["2018"] - df["1978"]
-top_rising = df.sort_values(by="Change_1978_2018", ascending=False).head(10).copy()
-
-# 지역 + 국가명 조합 컬럼 추가
-top_rising["location_country"] = top_rising["location"] + " (" + top_rising["country"] + ")"
-
-st.markdown("### 📌 해수면 상승이 큰 지역 Top 10")
-fig_bar = px.bar(top_rising, 
-                 x="location_country", 
-                 y="Change_1978_2018", 
-                 color="continent",
-                 title="1978~2018년 해수면 상승량 상위 지역",
-                 labels={"Change_1978_2018": "해수면 상승(mm)", "location_country": "지역 (국가)"})
-fig_bar.update_layout(title_font_size=18, xaxis_tickangle=-30)
-st.plotly_chart(fig_bar, use_container_width=True)
-
-
-# -------------------
-# 3️⃣ 국가별 상세 분석
-# -------------------
-st.markdown("### 🔍 특정 지역 상세 해수면 변화 분석")
-
-# 지역 + 국가명으로 표시
-df["location_country"] = df["location"] + " (" + df["country"] + ")"
-location_map = dict(zip(df["location_country"], df["location"]))
-
-selected_display = st.selectbox("지역 선택", df["location_country"].sort_values())
-selected_location = location_map[selected_display]  # 실제 location 값
-
-row = df[df["location"] == selected_location].iloc[0]
-
-# 해수면 시계열
-sea_level_series = row[year_columns].reset_index()
-sea_level_series.columns = ["Year", "Sea_Level"]
-sea_level_series["Year"] = sea_level_series["Year"].astype(int)
-
-fig_detail = px.line(sea_level_series, x="Year", y="Sea_Level", 
-                     title=f"{selected_location} ({row['country']}) 해수면 변화 추이")
-st.plotly_chart(fig_detail, use_container_width=True)
-st.caption("💡 그래프에서 데이터가 없는 연도는 관측값이 존재하지 않아 빈칸(NaN)으로 표시됩니다.")
-col1, col2, col3 = st.columns(3)
-col1.metric("1978년 해수면", f"{row['1978']} mm")
-col2.metric("2018년 해수면", f"{row['2018']} mm")
-col3.metric("총 변화량", f"{row['Change_1978_2018']} mm")
-
-# -------------------
-# 4️⃣ 토론 질문 및 교육적 함의
-# -------------------
-st.markdown("### 💬 학생 토론 질문")
-st.markdown("""
+with page_profiler():
+    st.title("📈 해수면 상승과 지속가능발전목표(SDGs)")
+
+    # 데이터 불러오기 (관측소 × 연도 행렬, 모든 세션 공유)
+    store = station_store()
+
+    # -------------------
+    # 1️⃣ 연도별 해수면 평균 변화 추이
+    # -------------------
+    df_yearly = store.yearly_mean
+    trend = global_trend()
+
+    st.markdown("### 🌊 전 세계 평균 해수면 변화 추이")
+    def build_yearly():
+        import plotly.express as px
+        fig_line = px.line(df_yearly, x="Year", y="Avg_Sea_Level", markers=True,
+                           labels={"Avg_Sea_Level": "해수면(mm)"},
+                           title="연도별 평균 해수면 변화")
+        fig_line.add_scatter(x=store.years, y=trend["intercept"] + trend["slope"] * store.years,
+                             mode="lines", line={"dash": "dash"},
+                             name=f"추세선 ({trend['slope']:+.2f} mm/년)")
+        fig_line.update_layout(title_font_size=18)
+        return fig_line
+
+    fig_line = cached_figure("sealevel.yearly", [SEALEVEL_FILE], build_yearly)
+    st.plotly_chart(fig_line, use_container_width=True)
+    st.caption(f"📐 최소제곱 추세: 연평균 {trend['slope']:+.2f} mm "
+               f"(95% 신뢰구간 {trend['ci_low']:+.2f} ~ {trend['ci_high']:+.2f} mm/년)")
+
+    # 위성 관측 전 지구 평균 해수면 (약 10일 간격)
+    #  ▸ 확대 구간 + 차트 폭에 맞춰 점을 솎아낸 뒤 전송 (봉우리 · 골짜기는 보존)
+    st.markdown("### 🛰️ 위성으로 관측한 전 지구 평균 해수면 (GMSL)")
+    gmsl = gmsl_series()
+
+    def build_gmsl(zoom, width_px):
+        import plotly.express as px
+        raw_pts = decimate_frame(gmsl, "Time", "GMSL_GIA", width_px, x_range=zoom)
+        smooth_pts = decimate_frame(gmsl, "Time", "SmoothedGSML_GIA", width_px, x_range=zoom)
+        fig_gmsl = px.line(raw_pts, x="Time", y="GMSL_GIA",
+                           labels={"Time": "연도", "GMSL_GIA": "해수면(mm)"},
+                           title="전 지구 평균 해수면 (GIA 보정)")
+        fig_gmsl.update_traces(name="관측값", showlegend=True, line={"width": 1})
+        fig_gmsl.add_scatter(x=smooth_pts["Time"], y=smooth_pts["SmoothedGSML_GIA"],
+                             mode="lines", name="평활값", line={"width": 3})
+        fig_gmsl.update_layout(title_font_size=18)
+        return fig_gmsl
+
+    # 확대 기간을 바꾸면 이 부분만 다시 실행
+    @fragment
+    def gmsl_section():
+        t_min, t_max = int(gmsl["Time"].min()), int(gmsl["Time"].max()) + 1
+        zoom = st.slider("확대할 기간", t_min, t_max, (t_min, t_max))
+        fig_gmsl = cached_figure("sealevel.gmsl", [GMSL_FILE], build_gmsl,
+                                 zoom=zoom, width_px=GMSL_WIDTH_PX)
+        st.plotly_chart(fig_gmsl, use_container_width=True)
+        st.caption(f"💡 선택 기간의 관측값 중 {len(fig_gmsl.data[0].x)}개 점만 화면 폭에 맞춰 골라 그렸습니다. "
+                   f"(전체 {len(gmsl)}개)")
+
+    gmsl_section()
+
+    # -------------------
+    # 2️⃣ 해수면 상승량 상위 지역
+    # -------------------
+
+    # 두 해의 차이(2018 - 1978) 대신 관측된 모든 해로 구한 추세(mm/년)로 순위 매기기
+    #  ▸ 2018년 값이 없는 관측소가 많아 단순 차이로는 일부 관측소만 비교됨
+    trends = station_trends()
+    top_rising = trends.dropna(subset=["slope"]).nlargest(10, "slope")
+
+    st.markdown("### 📌 해수면 상승이 빠른 지역 Top 10")
+    def build_top_rising():
+        import plotly.express as px
+        fig_bar = px.bar(top_rising, 
+                         x="label", 
+                         y="slope", 
+                         color="continent",
+                         error_y=top_rising["ci_high"] - top_rising["slope"],
+                         title="1978~2018년 해수면 상승 속도 상위 지역 (최소제곱 추세)",
+                         labels={"slope": "해수면 상승 속도(mm/년)", "label": "지역 (국가)"})
+        fig_bar.update_layout(title_font_size=18, xaxis_tickangle=-30)
+        return fig_bar
+
+    fig_bar = cached_figure("sealevel.top_rising", [SEALEVEL_FILE], build_top_rising)
+    st.plotly_chart(fig_bar, use_container_width=True)
+    st.caption(f"💡 전체 연도의 {MIN_COVERAGE:.0%} 이상 관측된 관측소 "
+               f"{int(trends['qualified'].sum())}곳만 비교합니다. 막대 위 선은 95% 신뢰구간입니다.")
+
+
+    # -------------------
+    # 3️⃣ 국가별 상세 분석
+    # -------------------
+    st.markdown("### 🔍 특정 지역 상세 해수면 변화 분석")
+
+    # 해수면 시계열 (제목의 지역 · 국가도 관측소 이름에서 바로 찾기)
+    def build_detail(station):
+        import plotly.express as px
+        row = store.station(station)
+        sea_level_series = store.series(station)
+        return px.line(sea_level_series, x="Year", y="Sea_Level", 
+                       title=f"{row['location']} ({row['country']}) 해수면 변화 추이")
+
+    # 관측소를 바꾸면 이 부분만 다시 실행 (위의 추세 · GMSL · 순위 차트는 그대로)
+    @fragment
+    def station_detail():
+        # 지역 + 국가명으로 표시 (해시 색인으로 바로 행 번호 찾기)
+        selected_display = st.selectbox("지역 선택", store.labels)
+
+        fig_detail = cached_figure("sealevel.detail", [SEALEVEL_FILE], build_detail,
+                                   station=selected_display)
+        st.plotly_chart(fig_detail, use_container_width=True)
+        st.caption("💡 그래프에서 데이터가 없는 연도는 관측값이 존재하지 않아 빈칸(NaN)으로 표시됩니다.")
+        level_1978 = store.value(selected_display, 1978)
+        level_2018 = store.value(selected_display, 2018)
+        station_trend = trends.iloc[store.row(selected_display)]
+        col1, col2, col3 = st.columns(3)
+        col1.metric("1978년 해수면", f"{level_1978} mm")
+        col2.metric("2018년 해수면", f"{level_2018} mm")
+        if station_trend["qualified"]:
+            col3.metric("상승 추세", f"{station_trend['slope']:+.2f} mm/년",
+                        help=f"95% 신뢰구간 {station_trend['ci_low']:+.2f} ~ {station_trend['ci_high']:+.2f} mm/년 "
+                             f"({int(station_trend['n_obs'])}개 연도 관측)")
+        else:
+            col3.metric("상승 추세", "관측 부족",
+                        help=f"관측 연도가 {int(station_trend['n_obs'])}개뿐이라 추세를 계산하지 않았습니다.")
+
+    station_detail()
+
+    # -------------------
+    # 4️⃣ 토론 질문 및 교육적 함의
+    # -------------------
+    st.markdown("### 💬 학생 토론 질문")
+    st.markdown("""
 - 해수면 상승이 어떤 방식으로 우리 삶에 영향을 미칠까요?
 - 기후 변화와 해수면 상승 간의 연관성은 무엇일까요?
 - 우리 지역은 해수면 상승에 얼마나 취약할까요?
 """)
 
-st.markdown("### 📚 교육적 함의")
-st.markdown("""
+    st.markdown("### 📚 교육적 함의")
+    st.markdown("""
 - 데이터를 통해 기후 변화의 구체적인 지표를 해석할 수 있음  
 - 지역과 글로벌 문제 간의 연계를 탐색하며 SDG 13(기후행동), SDG 14(해양생태계 보호)와 연결  
 - 과학적 근거 기반의 문제 해결 능력 강화
 """)
 
-st.markdown("### 🔍 확장 활동")
-st.markdown("""
+    st.markdown("### 🔍 확장 활동")
+    st.markdown("""
 - 우리 지역 해안선 지도 위에 예상 해수면 상승선을 그려보기  
 - 해안 도시들의 대응 사례를 조사하고 발표  
 - 해수면 상승을 막기 위한 국제 협력 사례 조사 및 토론
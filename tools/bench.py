@@ -0,0 +1,241 @@
+# tools/bench.py
+"""
+페이지별 rerun 지연 · 메모리 벤치마크 (streamlit.testing.v1.AppTest, 화면 없이 실행)
+
+페이지마다 새 파이썬 프로세스에서
+  1) cold : 캐시가 빈 상태의 첫 실행 시간
+  2) warm : 실제 사용처럼 위젯을 바꿔 가며 rerun (국가 선택, 연도 슬라이더,
+            관측소 선택 …) 을 여러 번 반복한 시간의 p50 / p95
+  3) peak_rss_mb : 프로세스 최대 메모리(RSS)
+를 재고 JSON 보고서를 씁니다. (디스크의 Arrow 캐시는 그대로 쓰므로 "cold" 는 프로세스 기준)
+
+    python tools/bench.py                               # 전체, 결과 출력
+    python tools/bench.py pages/05_05_sea_level.py -n 30
+    python tools/bench.py --json bench.json             # 보고서 저장
+    python tools/bench.py --baseline tools/bench_baseline.json   # 기준과 비교
+    python tools/bench.py --save-baseline               # 현재 결과를 기준으로 저장
+
+기준보다 `--tolerance`(기본 25%) 와 `--slack-ms`(기본 5ms) 를 모두 넘게 느려진
+항목이 있으면 종료 코드 1.
+"""
+import argparse
+import json
+import os
+import platform
+import resource
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+BASELINE_FILE = Path(__file__).with_name("bench_baseline.json")
+
+
+# ──────────────────────── 위젯 시나리오 ────────────────────────
+# 단계 이름 → (at, i) 를 받아 위젯 값을 바꾸는 함수. i 는 반복 번호로, 값을 돌려가며 고름.
+def _widget(at, kind, label):
+    for widget in at.get(kind):
+        if widget.label == label:
+            return widget
+    raise LookupError(f"{kind} '{label}' 를 찾지 못했습니다.")
+
+
+def _pick(options, i, k=1):
+    return [options[(i * 3 + j) % len(options)] for j in range(k)]
+
+
+def _selectbox(label):
+    def step(at, i):
+        w = _widget(at, "selectbox", label)
+        w.set_value(_pick(w.options, i * 7)[0])
+    return step
+
+
+def _slider(label):
+    def step(at, i):
+        w = _widget(at, "slider", label)
+        lo, hi = int(w.min), int(w.max)
+        w.set_value(hi - (i * 3) % (hi - lo + 1))
+    return step
+
+
+def _range_slider(label):
+    def step(at, i):
+        w = _widget(at, "slider", label)
+        lo, hi = int(w.min), int(w.max)
+        start = lo + (i * 2) % max(1, (hi - lo) // 2)
+        w.set_range(start, min(hi, start + 5 + i % 10))
+    return step
+
+
+SCENARIOS = {
+    "04_04_plastic waste.py": {
+        "country": _selectbox("국가를 선택하세요"),
+    },
+    "05_05_sea_level.py": {
+        "station": _selectbox("지역 선택"),
+        "zoom": _range_slider("확대할 기간"),
+    },
+    "06_06_undernourished people.py": {
+        "year": _slider("연도 선택"),
+    },
+    "07_07_birth rate.py": {
+        "year": _slider("연도 선택"),
+    },
+    "08_08_energy.py": {
+        "year": _slider("연도 선택"),
+    },
+}
+
+
+# ──────────────────────── 측정 (자식 프로세스) ──────────────────
+def _percentile(values, q):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, round(q * (len(ordered) - 1)))]
+
+
+def _summary(samples_ms):
+    return {
+        "p50_ms": round(statistics.median(samples_ms), 2),
+        "p95_ms": round(_percentile(samples_ms, 0.95), 2),
+        "n": len(samples_ms),
+    }
+
+
+def _timed_run(at):
+    start = time.perf_counter()
+    at.run()
+    elapsed = (time.perf_counter() - start) * 1000
+    if at.exception:
+        raise RuntimeError(at.exception[0].message)
+    return elapsed
+
+
+def run_page(page, repeats):
+    """한 페이지를 측정해 dict 로 돌려줍니다. (새 프로세스에서 호출)"""
+    sys.path.insert(0, str(ROOT))
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(str(page), default_timeout=120)
+    result = {"cold_ms": round(_timed_run(at), 2)}
+
+    steps = {"rerun": lambda at, i: None}            # 위젯 변화 없는 rerun
+    steps.update(SCENARIOS.get(page.name, {}))
+    per_step = {name: [] for name in steps}
+    for i in range(repeats):
+        for name, step in steps.items():
+            step(at, i)
+            per_step[name].append(_timed_run(at))
+
+    warm = [ms for samples in per_step.values() for ms in samples]
+    result["warm"] = _summary(warm)
+    result["steps"] = {name: _summary(samples) for name, samples in per_step.items()}
+    # ru_maxrss: Linux 는 KB, macOS 는 바이트
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    result["peak_rss_mb"] = round(rss / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+    return result
+
+
+def measure(page, repeats):
+    proc = subprocess.run(
+        [sys.executable, __file__, "--worker", str(page), "-n", str(repeats)],
+        capture_output=True, text=True, cwd=ROOT,
+        env=dict(os.environ, SDGS_PREWARM="0"),
+    )
+    if proc.returncode != 0:
+        return {"error": proc.stderr.strip().splitlines()[-1] if proc.stderr.strip() else "failed"}
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+# ──────────────────────── 기준 비교 ────────────────────────────
+def _metrics(page_result):
+    """비교할 지표만 평평하게: {"cold_ms": .., "warm.p95_ms": .., "steps.month.p50_ms": ..}"""
+    if "error" in page_result:
+        return {}
+    flat = {"cold_ms": page_result["cold_ms"]}
+    for q in ("p50_ms", "p95_ms"):
+        flat[f"warm.{q}"] = page_result["warm"][q]
+        for name, summary in page_result["steps"].items():
+            flat[f"steps.{name}.{q}"] = summary[q]
+    return flat
+
+
+def compare(report, baseline, tolerance, slack_ms):
+    """기준보다 느려진 항목 목록 [(페이지, 지표, 기준, 현재)]."""
+    regressions = []
+    for page, result in report["pages"].items():
+        if "error" in result:
+            regressions.append((page, "error", None, result["error"]))
+            continue
+        before = _metrics(baseline.get("pages", {}).get(page, {}))
+        for metric, now in _metrics(result).items():
+            old = before.get(metric)
+            if old is not None and now > old * (1 + tolerance) and now - old > slack_ms:
+                regressions.append((page, metric, old, now))
+    return regressions
+
+
+# ──────────────────────── 실행 ────────────────────────────────
+def default_pages():
+    return sorted((ROOT / "pages").glob("*.py")) + [ROOT / "main.py"]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("pages", nargs="*", type=Path, help="측정할 페이지 (기본: 전체)")
+    parser.add_argument("-n", "--repeats", type=int, default=10, help="warm 시나리오 반복 횟수")
+    parser.add_argument("--json", type=Path, help="보고서를 저장할 경로")
+    parser.add_argument("--baseline", type=Path, help="비교할 기준 보고서")
+    parser.add_argument("--save-baseline", action="store_true", help=f"결과를 {BASELINE_FILE.name} 로 저장")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="허용 비율 (기본 0.25)")
+    parser.add_argument("--slack-ms", type=float, default=5.0, help="허용 절대값 ms (기본 5)")
+    parser.add_argument("--worker", type=Path, help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.worker:
+        print(json.dumps(run_page(args.worker, args.repeats)))
+        return 0
+
+    import pandas as pd
+    import streamlit as st
+
+    report = {
+        "meta": {
+            "created": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "python": platform.python_version(),
+            "streamlit": st.__version__,
+            "pandas": pd.__version__,
+            "machine": platform.machine(),
+            "repeats": args.repeats,
+        },
+        "pages": {},
+    }
+    for page in [p.resolve() for p in args.pages] or default_pages():
+        result = measure(page, args.repeats)
+        report["pages"][page.name] = result
+        if "error" in result:
+            print(f"{'ERROR':>8}  {page.name}: {result['error']}")
+            continue
+        warm = result["warm"]
+        print(f"cold {result['cold_ms']:8.1f} ms  warm p50 {warm['p50_ms']:7.1f} / "
+              f"p95 {warm['p95_ms']:7.1f} ms  rss {result['peak_rss_mb']:6.1f} MB  {page.name}")
+
+    for path in filter(None, [args.json, BASELINE_FILE if args.save_baseline else None]):
+        path.write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+        regressions = compare(report, baseline, args.tolerance, args.slack_ms)
+        if regressions:
+            print("\n기준보다 느려진 항목:")
+            for page, metric, old, now in regressions:
+                print(f"  {page} · {metric}: {old} → {now}")
+            return 1
+        print("\n기준 대비 느려진 항목 없음")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
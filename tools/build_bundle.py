@@ -0,0 +1,243 @@
+# tools/build_bundle.py
+"""
+데이터 번들 만들기 (CSV 전부 + SDG 그림 17장 → bundle/ 폴더 하나)
+
+루트와 pages/ 에 흩어진 CSV 를 검사 · 정리해 타입이 정해진 Arrow 표로 바꾸고,
+images/sdg1~17.png 와 함께 한 파일(bundle-<버전>.bin)에 이어 붙인 뒤 manifest.json 을 씁니다.
+앱은 시작할 때 이 파일을 한 번 memory-map 하고(utils/bundle.py), 원본과 내용이 같은 표는
+CSV 를 파싱하지 않고 번들에서 바로 꺼냅니다. (CSV 가 바뀌면 그 파일만 CSV 에서 다시 읽음)
+
+    python tools/build_bundle.py            # bundle/ 에 새로 만들기
+    python tools/build_bundle.py --check    # 지금 번들이 원본과 같은지 확인만
+    python tools/build_bundle.py --out /tmp/bundle
+
+검사 항목
+- 인코딩을 감지할 수 있는지, 행이 있는지, 열 이름이 겹치지 않는지
+- 같은 이름의 CSV 가 두 폴더에 있으면 내용이 같은지 (같으면 루트 것만 담고, 다르면 오류)
+- SDG 그림 17장이 모두 있고 PNG 로 열리는지
+
+페이지가 read_csv 옵션을 바꿔 읽는 파일(KOSIS · 지명 사전)은 그 옵션으로 읽은 표도 함께 담습니다.
+문제가 하나라도 있으면 번들을 쓰지 않고 종료 코드 1.
+"""
+import argparse
+import csv
+import hashlib
+import io
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+import pyarrow as pa                                            # noqa: E402
+import pyarrow.ipc                                              # noqa: E402,F401
+
+from utils import bundle, geo, kosis                            # noqa: E402
+from utils.data import DATA_DIRS, _read                         # noqa: E402
+from utils.encoding import detect_encoding                      # noqa: E402
+
+ALIGN = 64
+IMAGE_COUNT = 17
+
+# 기본 옵션 말고도 함께 담을 read_csv 옵션 (utils 의 로더가 쓰는 그대로)
+EXTRA_READS = {
+    "born baby2.csv": [kosis.READ_OPTIONS],
+    "employmentrate.csv": [kosis.READ_OPTIONS],
+    geo.GAZETTEERS["kr_region"]["file"]: [geo.READ_OPTIONS],
+    geo.GAZETTEERS["country"]["file"]: [geo.READ_OPTIONS],
+}
+
+
+def sha256(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def source_info(path):
+    stat = path.stat()
+    return {"sha256": sha256(path), "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+
+# ──────────────────────── 원본 찾기 · 검사 ────────────────────────
+def find_csvs(errors):
+    """DATA_DIRS 순서대로 CSV 를 모읍니다. 같은 이름이 또 나오면 내용을 비교."""
+    found = {}
+    for folder in DATA_DIRS:
+        for path in sorted(folder.glob("*.csv")):
+            first = found.get(path.name)
+            if first is None:
+                found[path.name] = path
+            elif sha256(first) == sha256(path):
+                print(f"  = {bundle.entry_name(path)} 은 {bundle.entry_name(first)} 와 같아 한 번만 담습니다.")
+            else:
+                errors.append(f"{path.name}: {bundle.entry_name(first)} 와 {bundle.entry_name(path)} 의 내용이 다릅니다.")
+    return list(found.values())
+
+
+def read_variants(path, errors):
+    """파일 하나를 필요한 옵션마다 읽어 [(read_kwargs, DataFrame)] 로. 검사에 걸리면 빈 목록."""
+    name = bundle.entry_name(path)
+    if detect_encoding(str(path)) is None:
+        errors.append(f"{name}: 인코딩을 감지하지 못했습니다.")
+        return []
+    variants = []
+    for options in [{}] + EXTRA_READS.get(path.name, []):
+        read_kwargs = tuple(sorted(options.items()))
+        try:
+            df = _read(str(path), str(path), read_kwargs)
+        except (ValueError, UnicodeError) as e:
+            errors.append(f"{name}: 읽기 실패 ({e})")
+            return []
+        if df.empty:
+            errors.append(f"{name}: 데이터 행이 없습니다.")
+            return []
+        header = csv_header(path, df.attrs["encoding"])
+        duplicated = sorted({col for col in header if header.count(col) > 1})
+        if duplicated:
+            errors.append(f"{name}: 열 이름이 겹칩니다 {duplicated}")
+            return []
+        variants.append((read_kwargs, df))
+    return variants
+
+
+def csv_header(path, encoding):
+    """CSV 첫 줄의 열 이름 (pandas 가 겹치는 이름에 ".1" 을 붙이기 전)."""
+    with open(path, encoding=encoding, newline="") as f:
+        return [col.strip() for col in next(csv.reader(f), [])]
+
+
+def find_images(errors):
+    from PIL import Image
+
+    paths = []
+    for n in range(1, IMAGE_COUNT + 1):
+        path = ROOT / "images" / f"sdg{n}.png"
+        if not path.exists():
+            errors.append(f"{bundle.entry_name(path)}: 파일이 없습니다.")
+            continue
+        try:
+            with Image.open(path) as image:
+                image.verify()
+                if image.format != "PNG":
+                    raise ValueError(image.format)
+        except Exception as e:          # PIL 은 손상 종류마다 다른 예외를 냄
+            errors.append(f"{bundle.entry_name(path)}: PNG 로 열리지 않습니다 ({e})")
+            continue
+        paths.append(path)
+    return paths
+
+
+# ──────────────────────── 쓰기 ────────────────────────
+def arrow_bytes(df):
+    table = pa.Table.from_pandas(df)
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_file(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+class Packer:
+    """.bin 파일에 조각을 ALIGN 바이트 경계로 이어 붙이고 (offset, length) 를 돌려줍니다."""
+
+    def __init__(self):
+        self.out = io.BytesIO()
+
+    def add(self, data):
+        offset = self.out.tell()
+        self.out.write(data)
+        self.out.write(b"\0" * (-len(data) % ALIGN))
+        return {"offset": offset, "length": len(data)}
+
+
+def build(out_dir):
+    errors = []
+    csvs = find_csvs(errors)
+    tables = {path: read_variants(path, errors) for path in csvs}
+    images = find_images(errors)
+    if errors:
+        for message in errors:
+            print(f"  ✗ {message}")
+        return 1
+
+    packer = Packer()
+    manifest = {"format": bundle.FORMAT, "sources": {}, "tables": {}, "assets": {}}
+    for path, variants in tables.items():
+        name = bundle.entry_name(path)
+        manifest["sources"][name] = source_info(path)
+        for read_kwargs, df in variants:
+            entry = packer.add(arrow_bytes(df))
+            entry.update(rows=len(df), columns=[str(c) for c in df.columns], attrs=df.attrs)
+            manifest["tables"][bundle.table_key(name, read_kwargs)] = entry
+        print(f"  ✓ {name}: 표 {len(variants)}개, {len(variants[0][1]):,}행")
+    for path in images:
+        name = bundle.entry_name(path)
+        info = source_info(path)
+        manifest["sources"][name] = info
+        manifest["assets"][name] = {**packer.add(path.read_bytes()), "mime": "image/png", "sha256": info["sha256"]}
+    print(f"  ✓ 그림 {len(images)}장")
+
+    digest = hashlib.sha256(
+        json.dumps({k: v["sha256"] for k, v in manifest["sources"].items()}, sort_keys=True).encode()
+    ).hexdigest()
+    manifest["created"] = time.strftime("%Y-%m-%dT%H:%M:%S%z")
+    manifest["version"] = f"{time.strftime('%Y%m%d%H%M%S')}-{digest[:8]}"
+    manifest["data"] = f"bundle-{manifest['version']}.bin"
+
+    # .bin 은 버전마다 새 이름으로 쓰고 manifest 를 마지막에 바꿔치기
+    # → 실행 중인 앱은 옛 파일을 계속 쓰고, 새로 뜨는 앱은 새 manifest 와 새 .bin 을 함께 봄
+    out_dir.mkdir(parents=True, exist_ok=True)
+    for file_name, data in [
+        (manifest["data"], packer.out.getvalue()),
+        (bundle.MANIFEST_NAME, json.dumps(manifest, ensure_ascii=False, indent=1).encode()),
+    ]:
+        tmp = out_dir / f"{file_name}.{os.getpid()}.tmp"
+        tmp.write_bytes(data)
+        os.replace(tmp, out_dir / file_name)
+    for old in out_dir.glob("bundle-*.bin"):
+        if old.name != manifest["data"]:
+            old.unlink()                # 이미 memory-map 한 프로세스는 지워도 그대로 읽음
+    size = (out_dir / manifest["data"]).stat().st_size
+    print(f"번들 {manifest['version']} → {out_dir} ({size / 1024 / 1024:.1f} MB)")
+    return 0
+
+
+def check(out_dir):
+    """번들의 원본 해시가 지금 파일과 같은지 확인합니다. 다르면 종료 코드 1."""
+    try:
+        manifest = json.loads((out_dir / bundle.MANIFEST_NAME).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        print(f"{out_dir} 에 번들이 없습니다.")
+        return 1
+    stale = []
+    if manifest.get("format") != bundle.FORMAT:
+        stale.append(f"형식 {manifest.get('format')} (지금 앱은 {bundle.FORMAT})")
+    for name, info in manifest["sources"].items():
+        path = ROOT / name
+        if not path.exists():
+            continue                    # 번들만 배포한 경우 — 번들이 원본
+        if sha256(path) != info["sha256"]:
+            stale.append(f"{name}: 바뀜")
+    current = {bundle.entry_name(p) for p in find_csvs([])}
+    stale += [f"{name}: 새 파일" for name in sorted(current - set(manifest["sources"]))]
+    for message in stale:
+        print(f"  ✗ {message}")
+    print(f"번들 {manifest['version']}: " + ("다시 만들어야 합니다." if stale else "원본과 같습니다."))
+    return 1 if stale else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--out", type=Path, default=bundle.BUNDLE_DIR, help="번들 폴더 (기본: bundle/)")
+    parser.add_argument("--check", action="store_true", help="만들지 않고 원본과 같은지만 확인")
+    args = parser.parse_args()
+    return check(args.out) if args.check else build(args.out)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,58 @@
+# tools/check_prewarm.py
+"""
+예열(utils/prewarm.py)이 페이지의 기본 화면 차트를 모두 채우는지 확인
+
+한 프로세스에서 예열 스레드를 앱과 똑같이 돌려 끝날 때까지 기다린 뒤, 페이지마다 AppTest 로 첫 방문을 흉내 냅니다.
+첫 방문에서 차트 캐시(utils/figcache.py)에 새로 생긴 항목 = 예열이 채우지 못한 차트입니다.
+fragment 안의 차트처럼 세션 없는 스레드에서 건너뛰는 부분이 생기면 여기서 드러납니다.
+
+    python tools/check_prewarm.py          # 빠진 차트가 있으면 종료 코드 1
+"""
+import os
+import sys
+import threading
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+os.chdir(ROOT)
+
+from streamlit.testing.v1 import AppTest                        # noqa: E402
+
+from utils import prewarm                                       # noqa: E402
+from utils.figcache import figure_cache                         # noqa: E402
+
+
+def cached_keys():
+    return set(figure_cache()._items)
+
+
+def main():
+    status = prewarm.PrewarmStatus(pages=sorted(prewarm.PAGES_DIR.glob("*.py")))
+    prewarm._quiet_missing_context()
+    thread = threading.Thread(target=prewarm._run, args=(status,), name=prewarm.THREAD_NAME)
+    thread.start()
+    thread.join()
+    for page, error in status.errors.items():
+        print(f"  ! 예열 중 {page}: {error}")
+
+    missed = {}
+    for page in status.pages:
+        before = cached_keys()
+        at = AppTest.from_file(str(page), default_timeout=120)
+        at.run()
+        if at.exception:
+            missed[page.stem] = [f"예외: {at.exception[0].value}"]
+            continue
+        new = sorted({key[0] for key in cached_keys() - before})
+        if new:
+            missed[page.stem] = new
+
+    for page, charts in missed.items():
+        print(f"  ✗ {page}: {', '.join(charts)}")
+    print(f"예열 확인 ({status.elapsed:.1f}초): " + ("빠진 차트가 있습니다." if missed else "모든 차트가 채워졌습니다."))
+    return 1 if missed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,103 @@
+# tools/importtime.py
+"""
+페이지별 import 시간 측정 (`python -X importtime` 보고서를 페이지 단위로 요약)
+
+각 페이지를 새 파이썬 프로세스에서 `-X importtime` 으로 한 번 실행(AppTest)하고,
+페이지 스크립트가 시작된 뒤에 새로 불러온 모듈만 모아 집계합니다.
+(streamlit · AppTest 자체를 불러오는 시간은 빠짐. main.py 의 백그라운드 예열은 끄고 측정)
+
+    python tools/importtime.py                      # 전체 페이지 + main.py
+    python tools/importtime.py pages/03_03_fire.py  # 특정 페이지만
+    python tools/importtime.py --top 10             # 무거운 패키지 10개까지 표시
+
+예산 파일(tools/import_budget.json)의 한도(ms)를 넘는 페이지가 있으면 종료 코드 1.
+교실용 작은 VM 에서 콜드 스타트가 다시 느려지지 않도록 확인하는 용도입니다.
+"""
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+BUDGET_FILE = Path(__file__).with_name("import_budget.json")
+MARKER = "sdgs-importtime: page start"
+
+# 자식 프로세스: streamlit · AppTest 를 먼저 불러온 뒤 표시를 남기고 페이지 실행
+RUNNER = """
+import sys
+sys.path.insert(0, {root!r})
+from streamlit.testing.v1 import AppTest
+print({marker!r}, file=sys.stderr, flush=True)
+AppTest.from_file({page!r}, default_timeout=120).run()
+"""
+
+LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+
+
+def default_pages():
+    return sorted((ROOT / "pages").glob("*.py")) + [ROOT / "main.py"]
+
+
+def measure(page):
+    """페이지가 새로 불러온 최상위 import → 누적 시간(µs)."""
+    code = RUNNER.format(root=str(ROOT), marker=MARKER, page=str(page))
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True, text=True, cwd=ROOT,
+        env=dict(os.environ, SDGS_PREWARM="0"),
+    )
+    _, _, after = proc.stderr.partition(MARKER)
+    totals = {}
+    for match in LINE.finditer(after):
+        _, cumulative, indent, name = match.groups()
+        if len(indent) == 1:                # 최상위 import 만 (하위는 누적값에 포함됨)
+            package = name.split(".")[0]
+            totals[package] = totals.get(package, 0) + int(cumulative)
+    return totals
+
+
+def load_budget(path):
+    if not path.exists():
+        return {"default_ms": None, "pages": {}}
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("pages", nargs="*", type=Path, help="측정할 페이지 (기본: 전체)")
+    parser.add_argument("--budget", type=Path, default=BUDGET_FILE, help="페이지별 한도(ms) JSON")
+    parser.add_argument("--top", type=int, default=5, help="표시할 무거운 패키지 수")
+    parser.add_argument("--json", type=Path, help="결과를 JSON 으로 저장할 경로")
+    args = parser.parse_args(argv)
+
+    budget = load_budget(args.budget)
+    report, over = {}, []
+    for page in [p.resolve() for p in args.pages] or default_pages():
+        totals = measure(page)
+        total_ms = sum(totals.values()) / 1000
+        limit = budget["pages"].get(page.name, budget.get("default_ms"))
+        status = "OK" if limit is None or total_ms <= limit else "OVER"
+        if status == "OVER":
+            over.append(page.name)
+        heavy = sorted(totals.items(), key=lambda kv: -kv[1])[:args.top]
+        report[page.name] = {"total_ms": round(total_ms, 1), "budget_ms": limit,
+                             "top": {name: round(us / 1000, 1) for name, us in heavy}}
+
+        limit_text = "-" if limit is None else f"{limit:.0f}"
+        print(f"{status:4} {total_ms:8.1f} ms / {limit_text:>5} ms  {page.name}")
+        for name, us in heavy:
+            print(f"{'':22}{us / 1000:8.1f} ms  {name}")
+
+    if args.json:
+        args.json.write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+    if over:
+        print(f"\n예산 초과: {', '.join(over)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
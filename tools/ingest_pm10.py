@@ -0,0 +1,112 @@
+# tools/ingest_pm10.py
+"""
+에어코리아 시간별 PM10 확정자료 → 2번 페이지(미세먼지)용 월별 · 시도별 CSV
+
+측정소 수백 곳 × 몇 년 치(수천만 행)의 원본을 조각으로 흘려 읽고 여러 코어에서 집계합니다.
+(utils/airkorea.py) 결과는 페이지가 지금 읽는 표와 같은 모양(행 = 지역, 열 = "2024년01월")으로 씁니다.
+
+    python tools/ingest_pm10.py raw/2023*.csv raw/2024*.csv
+    python tools/ingest_pm10.py raw/*.csv --out /tmp/pm10 --workers 4
+    python tools/ingest_pm10.py raw/*.csv --extra-out /tmp/pm10-extra
+
+쓰는 파일
+    --out (기본: pages/)
+        미세먼지_PM10__월별_도시별_대기오염도.csv     월평균 — 페이지가 읽는 파일 (덮어씀)
+    --extra-out (줄 때만, 데이터 폴더 밖이어야 함)
+        미세먼지_PM10__월별_도시별_최고농도.csv       월 최고(1시간 값)
+        미세먼지_PM10__월별_도시별_기준초과일수.csv   24시간 환경기준을 넘은 날 수
+
+페이지가 읽지 않는 표를 루트 · pages/ 에 두면 로더 검색과 데이터 번들(tools/build_bundle.py)에
+그대로 들어가므로, 추가 표는 데이터 폴더 밖에만 씁니다.
+
+실행 중인 앱은 파일 감시(utils/watch.py)로 다음 rerun 부터 새 표를 씁니다.
+"""
+import argparse
+import logging
+import os
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from utils import airkorea                                      # noqa: E402
+from utils.data import DATA_DIRS                                # noqa: E402
+
+PAGE_OUTPUT = ("mean", "미세먼지_PM10__월별_도시별_대기오염도.csv")      # 2번 페이지가 읽는 표
+EXTRA_OUTPUTS = {
+    "max": "미세먼지_PM10__월별_도시별_최고농도.csv",
+    "exceed": "미세먼지_PM10__월별_도시별_기준초과일수.csv",
+}
+
+
+def region_names(prefixes):
+    """원본 지역 앞 단어 → 지명 사전의 정식 이름. 사전에 없는 이름은 알리고 그대로 둠."""
+    from utils.geo import locate
+
+    prefixes = sorted(prefixes)
+    found = locate(prefixes, "kr_region")["name"]
+    unknown = [p for p, name in zip(prefixes, found) if not isinstance(name, str)]
+    if unknown:
+        print(f"  ! 지명 사전에 없는 지역(그대로 씀): {unknown}")
+    return {p: name for p, name in zip(prefixes, found) if isinstance(name, str)}
+
+
+def region_order(table):
+    """지명 사전 순서(서울 → 부산 → … → 제주)로 행을 정렬. 사전에 없는 지역은 뒤로."""
+    from utils.geo import gazetteer
+
+    order = {name: i for i, name in enumerate(gazetteer("kr_region")[0]["name"])}
+    rank = table[airkorea.REGION].map(lambda r: order.get(r, len(order)))
+    return table.iloc[rank.argsort(kind="stable")].reset_index(drop=True)
+
+
+def write_csv(df, path):
+    # 실행 중인 앱이 반쯤 쓴 파일을 읽지 않도록 임시 파일에 쓰고 바꿔치기
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    df.to_csv(tmp, index=False, encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("files", nargs="+", type=Path, help="에어코리아 시간별 확정자료 CSV")
+    parser.add_argument("--out", type=Path, default=ROOT / "pages", help="결과 폴더 (기본: pages/)")
+    parser.add_argument("--extra-out", type=Path, help="월 최고 · 기준 초과 일수 표를 쓸 폴더 (데이터 폴더 밖)")
+    parser.add_argument("--workers", type=int, default=None, help="프로세스 수 (기본: 코어 수)")
+    parser.add_argument("--chunk-rows", type=int, default=airkorea.CHUNK_ROWS, help="한 번에 읽는 행 수")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="  %(message)s")
+
+    missing = [str(f) for f in args.files if not f.exists()]
+    if missing:
+        parser.error(f"파일이 없습니다: {missing}")
+    if args.extra_out and args.extra_out.resolve() in [d.resolve() for d in DATA_DIRS]:
+        parser.error(f"--extra-out 은 데이터 폴더({', '.join(str(d) for d in DATA_DIRS)}) 밖이어야 합니다.")
+
+    start = time.perf_counter()
+    daily = airkorea.aggregate_files(args.files, args.workers, args.chunk_rows)
+    if daily.empty:
+        print("유효한 PM10 값이 없습니다.")
+        return 1
+    names = region_names(daily.index.get_level_values(0).unique())
+    tables = airkorea.monthly_tables(daily, names)
+
+    metric, file_name = PAGE_OUTPUT
+    args.out.mkdir(parents=True, exist_ok=True)
+    write_csv(region_order(tables[metric]), args.out / file_name)
+    if args.extra_out:
+        args.extra_out.mkdir(parents=True, exist_ok=True)
+        for metric, file_name in EXTRA_OUTPUTS.items():
+            write_csv(region_order(tables[metric]), args.extra_out / file_name)
+    mean = tables["mean"]
+    print(
+        f"{len(args.files)}개 파일 → 지역 {len(mean)}곳 × {len(mean.columns) - 1}개월 "
+        f"({time.perf_counter() - start:.1f}초) → {args.out}"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
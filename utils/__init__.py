@@ -0,0 +1,2 @@
+# utils/__init__.py
+"""여러 페이지가 함께 쓰는 공용 도구 모음."""
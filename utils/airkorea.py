@@ -0,0 +1,141 @@
+# utils/airkorea.py
+"""
+에어코리아 시간별 측정소 자료 → 월별 · 도시(시도)별 PM10 표
+
+에어코리아 "확정자료" CSV 는 측정소 수백 곳의 한 시간 값이 한 행씩이라
+몇 년 치면 수천만 행이 됩니다. 한 번에 읽지 않고 CHUNK_ROWS 행씩 흘려 읽으면서
+(시도, 날짜)별 합계 · 개수 · 최댓값만 남기므로, 메모리는 원본 크기가 아니라
+시도 수 × 날짜 수에 비례합니다. 파일이 여러 개면 파일마다 다른 프로세스(코어)에서 읽습니다.
+
+- 필요한 열(지역, 측정일시, PM10)만 읽고, 지역은 category 로 받아 문자열을 한 번만 만듦
+- 측정일시 2024010124 처럼 24시는 그날 마지막 시간으로 봄 (날짜 = 측정일시 // 100)
+- 지역 "서울 중구" → 앞 단어 "서울" → 지명 사전(gazetteer_kr_regions.csv)의 "서울특별시"
+- 결과는 페이지가 쓰는 모양 그대로: 행 = 지역, 열 = "2024년01월" …
+
+    월평균      : 그 달 모든 측정소 · 시간 값의 평균
+    월 최고     : 그 달 가장 높았던 한 시간 값
+    기준 초과 일수 : 도시 하루 평균이 24시간 환경기준(STANDARD_24H)을 넘은 날 수
+                   (유효 측정값이 MIN_HOURS 개 미만인 날은 세지 않음)
+
+예) tables = ingest(["2023년 1분기.csv", "2023년 2분기.csv"])
+    tables["mean"]      # 지역 × 월 (wide)
+"""
+import logging
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from utils.encoding import detect_encoding
+
+REGION, TIME, VALUE = "지역", "측정일시", "PM10"
+CHUNK_ROWS = 1_000_000
+STANDARD_24H = 100          # PM10 24시간 환경기준 (㎍/㎥)
+MIN_HOURS = 18              # 하루 평균으로 인정하는 최소 유효 측정값 수 (24시간의 75%)
+
+logger = logging.getLogger(__name__)
+
+
+def _region_prefix(regions):
+    """category 지역 열 → 앞 단어("서울 중구" → "서울") category. 문자열 처리는 범주 수만큼만."""
+    prefixes = pd.Categorical(regions.cat.categories.astype(str).str.split().str[0])
+    codes = regions.cat.codes.to_numpy()
+    return pd.Categorical.from_codes(
+        np.where(codes >= 0, prefixes.codes[codes], -1), prefixes.categories,
+    )
+
+
+def aggregate_chunk(chunk):
+    """원본 조각 → (시도 앞 단어, 날짜)별 [sum, count, max]."""
+    values = pd.to_numeric(chunk[VALUE], errors="coerce")
+    valid = values.notna() & (values >= 0)          # 빈칸 · 음수(점검 · 장비 이상 표시)는 제외
+    part = pd.DataFrame({
+        "region": _region_prefix(chunk[REGION].astype("category"))[valid.to_numpy()],
+        "day": (chunk[TIME][valid] // 100).to_numpy(),
+        "value": values[valid].to_numpy(dtype="float64"),
+    })
+    return part.groupby(["region", "day"], observed=True)["value"].agg(["sum", "count", "max"])
+
+
+def merge_partials(partials):
+    """조각별 [sum, count, max] 를 같은 (시도, 날짜)끼리 합칩니다."""
+    partials = [p for p in partials if len(p)]
+    if not partials:
+        return pd.DataFrame(columns=["sum", "count", "max"])
+    both = pd.concat(partials)
+    both.index = both.index.set_levels(both.index.levels[0].astype(str), level=0)
+    return both.groupby(level=[0, 1]).agg({"sum": "sum", "count": "sum", "max": "max"})
+
+
+def aggregate_file(path, chunk_rows=CHUNK_ROWS):
+    """파일 하나를 조각으로 흘려 읽으며 집계합니다. (작업 프로세스에서 실행)"""
+    encoding = detect_encoding(path)
+    if encoding is None:
+        raise UnicodeError(f"{path}: 파일 인코딩을 감지하지 못했습니다.")
+    reader = pd.read_csv(
+        path, encoding=encoding, usecols=[REGION, TIME, VALUE],
+        dtype={REGION: "category", TIME: "int64", VALUE: "float64"},
+        na_values=["", "-"], chunksize=chunk_rows,
+    )
+    state, rows = None, 0
+    with reader:
+        for chunk in reader:
+            rows += len(chunk)
+            part = aggregate_chunk(chunk)
+            # 조각을 쌓아 두지 않고 바로 합쳐, 메모리가 (시도 × 날짜) 이상 늘지 않게 함
+            state = part if state is None else merge_partials([state, part])
+    logger.info("%s: %s행 집계", path, f"{rows:,}")
+    return merge_partials([state]) if state is not None else merge_partials([])
+
+
+def aggregate_files(paths, workers=None, chunk_rows=CHUNK_ROWS):
+    """여러 파일을 프로세스 여러 개로 나눠 집계한 뒤 합칩니다. workers=1 이면 이 프로세스에서."""
+    paths = [str(p) for p in paths]
+    if workers == 1 or len(paths) == 1:
+        return merge_partials([aggregate_file(p, chunk_rows) for p in paths])
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return merge_partials(list(pool.map(aggregate_file, paths, [chunk_rows] * len(paths))))
+
+
+def month_label(months):
+    """202401 → "2024년01월" (원래 CSV 의 열 이름 형식)."""
+    months = np.asarray(months)
+    return [f"{m // 100}년{m % 100:02d}월" for m in months]
+
+
+def monthly_tables(daily, region_names=None):
+    """
+    (시도, 날짜)별 [sum, count, max] → {"mean", "max", "exceed"} 세 wide 표 (행 = 지역, 열 = 월).
+    region_names : 앞 단어 → 정식 이름 (예: {"서울": "서울특별시"}). 없는 이름은 그대로 씀.
+    """
+    daily = daily.reset_index()
+    daily.columns = ["region", "day", "sum", "count", "max"]
+    if region_names:
+        # "강원" · "강원도" 처럼 같은 시도를 가리키는 앞 단어는 합친 뒤 하루 평균을 냄
+        daily["region"] = daily["region"].map(lambda r: region_names.get(r, r))
+        daily = daily.groupby(["region", "day"], as_index=False).agg(
+            {"sum": "sum", "count": "sum", "max": "max"}
+        )
+    daily["month"] = daily["day"] // 100
+    daily["exceed"] = (
+        (daily["count"] >= MIN_HOURS) & (daily["sum"] / daily["count"] > STANDARD_24H)
+    ).astype("int64")
+
+    monthly = daily.groupby(["region", "month"]).agg(
+        sum=("sum", "sum"), count=("count", "sum"), max=("max", "max"), exceed=("exceed", "sum"),
+    )
+    monthly["mean"] = monthly["sum"] / monthly["count"]
+
+    tables = {}
+    for metric in ("mean", "max", "exceed"):
+        # 원래 CSV 처럼 정수로 (자료가 없는 달은 빈칸)
+        wide = monthly[metric].round().astype("Int64").unstack("month").sort_index(axis=1)
+        wide.columns = month_label(wide.columns)
+        wide.index.name = REGION
+        tables[metric] = wide.reset_index()
+    return tables
+
+
+def ingest(paths, workers=None, chunk_rows=CHUNK_ROWS, region_names=None):
+    """시간별 원본 CSV 들 → 월별 · 시도별 {"mean", "max", "exceed"} wide 표."""
+    return monthly_tables(aggregate_files(paths, workers, chunk_rows), region_names)
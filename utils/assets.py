@@ -0,0 +1,65 @@
+# utils/assets.py
+"""
+그림 등 프로젝트 파일 읽기 (pandas 없이)
+
+소개 페이지처럼 데이터가 필요 없는 페이지도 쓰므로 utils.data(→ pandas)를 불러오지 않습니다.
+경로는 실행 폴더가 아니라 프로젝트 루트 기준이고, 디스크에 없으면 데이터 번들(utils/bundle.py)에서 꺼냅니다.
+
+예) png = load_asset("images/sdg1.png")     # bytes, 없으면 None
+
+작게 보여 줄 그림은 `icon_set()` 으로 표시 크기에 맞춰 한 번만 줄여 둡니다.
+st.image(width=100) 에 원본(약 180px)을 주면 Streamlit 이 rerun 마다 그림을 열어 줄이고
+PNG 로 다시 인코딩하지만, 이미 그 폭 이하인 PNG 는 받은 바이트를 그대로 씁니다.
+미디어 URL 은 내용 해시로 정해지므로 rerun 마다 같은 URL → 브라우저가 캐시합니다.
+"""
+import io
+
+import streamlit as st
+
+from utils.bundle import ROOT, entry_name, open_bundle
+
+
+@st.cache_resource(show_spinner=False, max_entries=64)
+def _read_asset(path, mtime_ns, size):
+    # mtime_ns · size 는 캐시 키 (파일이 바뀌면 다시 읽음)
+    return path.read_bytes()
+
+
+def load_asset(name):
+    """루트 기준 경로 → 파일 바이트. 디스크와 번들 어디에도 없으면 None."""
+    path = (ROOT / name).resolve()
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        bundle = open_bundle()
+        return bundle.asset(entry_name(path)) if bundle else None
+    return _read_asset(path, stat.st_mtime_ns, stat.st_size)
+
+
+def shrink_png(data, width):
+    """그림 바이트 → 폭 width 이하의 팔레트 PNG (비율 유지, 투명도 유지)."""
+    from PIL import Image
+
+    with Image.open(io.BytesIO(data)) as image:
+        image = image.convert("RGBA")
+        if image.width > width:
+            height = round(image.height * width / image.width)
+            image = image.resize((width, height), Image.Resampling.LANCZOS)
+        image = image.quantize(256, method=Image.Quantize.FASTOCTREE)
+        out = io.BytesIO()
+        image.save(out, "PNG", optimize=True)
+    return out.getvalue()
+
+
+@st.cache_resource(show_spinner=False)
+def icon_set(names, width):
+    """
+    그림 여러 장을 (프로세스당 한 번) 읽고 줄여 {이름: PNG 바이트} 로. 없는 그림은 빠집니다.
+    아이콘은 앱 실행 중에 바뀌지 않는다고 보고, 그 뒤로는 파일을 확인하지 않습니다.
+    """
+    icons = {}
+    for name in names:
+        data = load_asset(name)
+        if data is not None:
+            icons[name] = shrink_png(data, width)
+    return icons
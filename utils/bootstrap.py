@@ -0,0 +1,25 @@
+# utils/bootstrap.py
+"""
+프로세스 전역 설정 (한 곳에서 한 번)
+
+Streamlit 은 main.py 를 거치지 않고 페이지 파일만 실행하기도 합니다.
+(주소로 바로 들어온 경우 · AppTest · 예열 스레드의 runpy) 그래서 전역 설정은 main.py 가 아니라
+공유 프레임을 만드는 유일한 입구인 로더(utils/data.py)가 불러올 때 configure() 로 켭니다.
+
+- pandas Copy-on-Write
+  캐시에 든 프레임은 모든 세션이 함께 쓰고, 페이지에는 얕은 복사 뷰(utils/shared.py)만 내줍니다.
+  CoW 가 꺼져 있으면 뷰에서 값을 바꾸는 순간 공유 원본까지 바뀌므로, 첫 프레임을 만들기 전에 켜야 합니다.
+  어느 모듈을 먼저 import 했는지에 따라 켜지고 말고가 달라지지 않도록 여기서만 설정합니다.
+"""
+_configured = False
+
+
+def configure():
+    """전역 설정을 적용합니다. 여러 번 불러도 한 번만 적용."""
+    global _configured
+    if _configured:
+        return
+    import pandas as pd
+
+    pd.set_option("mode.copy_on_write", True)
+    _configured = True
@@ -0,0 +1,95 @@
+# utils/bundle.py
+"""
+데이터 번들 (tools/build_bundle.py 가 만든 파일) 읽기
+
+번들은 폴더 하나에 두 파일로 이루어집니다.
+
+    bundle/manifest.json          형식 번호 · 버전 · 항목별 (위치, 길이, 원본 해시 …)
+    bundle/bundle-<버전>.bin      모든 표(Arrow IPC) 와 그림(PNG) 을 이어 붙인 파일
+
+앱은 시작할 때 manifest 를 읽고 거기 적힌 .bin 파일을 한 번만 memory-map 해서,
+표는 그 안의 조각을 Arrow → pandas 로, 그림은 바이트로 꺼냅니다.
+(결측 없는 숫자 열만 mmap 버퍼를 그대로 쓰고, 문자열 · category 열은 pandas 로 복사됨)
+항목 이름은 프로젝트 루트 기준 상대 경로(예: "pages/미세먼지….csv", "images/sdg1.png")라
+앱을 어느 폴더에서 실행하든 같은 파일을 가리킵니다.
+
+번들이 없거나 형식이 다르면 None → 로더는 지금처럼 CSV 를 직접 읽습니다.
+"""
+import json
+import os
+from dataclasses import dataclass
+from pathlib import Path
+
+import streamlit as st
+
+FORMAT = 2                  # 저장 형식이 바뀌면 올림 (2: 측정값 열은 dtype 을 줄이지 않음)
+ROOT = Path(__file__).resolve().parent.parent
+BUNDLE_DIR = Path(os.environ.get("SDGS_BUNDLE", ROOT / "bundle"))
+MANIFEST_NAME = "manifest.json"
+
+
+def entry_name(path):
+    """실제 경로 → 번들 항목 이름 (루트 기준 상대 경로, "/" 구분)."""
+    path = Path(path).resolve()
+    try:
+        return path.relative_to(ROOT).as_posix()
+    except ValueError:
+        return path.as_posix()
+
+
+def table_key(name, read_kwargs):
+    """같은 파일도 read_csv 옵션이 다르면 다른 표로 저장합니다."""
+    return f"{name}|{read_kwargs!r}"
+
+
+@dataclass(frozen=True)
+class Bundle:
+    manifest: dict
+    buffer: object              # pyarrow.Buffer (.bin 전체를 memory-map 한 것)
+
+    @property
+    def version(self):
+        return self.manifest["version"]
+
+    def source(self, name):
+        """원본 파일 정보 {sha256, size, mtime_ns} 또는 None."""
+        return self.manifest["sources"].get(name)
+
+    def _slice(self, entry):
+        return self.buffer.slice(entry["offset"], entry["length"])
+
+    def table(self, name, read_kwargs):
+        """표 하나를 DataFrame 으로 (없으면 None)."""
+        import pyarrow as pa
+
+        entry = self.manifest["tables"].get(table_key(name, read_kwargs))
+        if entry is None:
+            return None
+        table = pa.ipc.open_file(self._slice(entry)).read_all()
+        df = table.to_pandas(split_blocks=True)
+        df.attrs.update(entry.get("attrs", {}))
+        return df
+
+    def asset(self, name):
+        """그림 등 파일 바이트 (없으면 None)."""
+        entry = self.manifest["assets"].get(name)
+        return None if entry is None else self._slice(entry).to_pybytes()
+
+
+@st.cache_resource(show_spinner=False)
+def open_bundle(folder=BUNDLE_DIR):
+    """번들을 (프로세스당 한 번) 엽니다. 없거나 형식이 맞지 않으면 None."""
+    import pyarrow as pa
+
+    folder = Path(folder)
+    try:
+        manifest = json.loads((folder / MANIFEST_NAME).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if manifest.get("format") != FORMAT:
+        return None
+    try:
+        buffer = pa.memory_map(str(folder / manifest["data"]), "r").read_buffer()
+    except (OSError, pa.ArrowException):
+        return None
+    return Bundle(manifest, buffer)
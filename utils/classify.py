@@ -0,0 +1,93 @@
+# utils/classify.py
+"""
+구간(등급) 분류기
+
+경계값 표 하나로 열 전체를 한 번에 등급 · 색상 · 순위로 바꿉니다.
+행마다 파이썬 함수를 부르는 `.apply` 대신 np.searchsorted 로 처리하므로
+시간 단위 측정소 데이터처럼 행이 많아도 그대로 쓸 수 있습니다.
+"""
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+
+@dataclass(frozen=True)
+class GradeScale:
+    labels: tuple                   # 낮은 등급 → 높은 등급
+    colors: tuple                   # 등급별 RGBA
+    upper: tuple = None             # 등급별 상한(포함). 마지막은 보통 inf. 범주형 척도면 None
+    missing_label: str = "정보없음"
+    missing_color: tuple = (200, 200, 200, 160)
+
+    def grade_index(self, values):
+        """값 → 등급 번호(0 부터). 결측이거나 범위 밖이면 -1."""
+        if self.upper is None:
+            raise ValueError("경계값(upper)이 없는 척도는 수치 분류를 할 수 없습니다.")
+        values = np.asarray(values, dtype="float64")
+        idx = np.searchsorted(np.asarray(self.upper, dtype="float64"), values, side="left")
+        idx[np.isnan(values) | (idx >= len(self.labels))] = -1
+        return idx
+
+    def label_index(self, labels):
+        """등급 이름 → 등급 번호(0 부터). 모르는 이름이나 결측은 -1."""
+        return pd.Categorical(labels, categories=self.labels).codes.astype("int64")
+
+    def grade(self, values):
+        """값 → 등급 이름 (순서 있는 범주형)."""
+        return pd.Categorical.from_codes(self.grade_index(values), self.labels, ordered=True)
+
+    def labels_for_index(self, idx):
+        """등급 번호 → 등급 이름 배열(object). -1 은 missing_label. (지도 툴팁 등 표시용)"""
+        names = np.asarray(self.labels + (self.missing_label,), dtype=object)
+        return names[np.asarray(idx)]
+
+    def labels_for(self, values):
+        """값 → 등급 이름 배열."""
+        return self.labels_for_index(self.grade_index(values))
+
+    def rank(self, labels):
+        """등급 이름 → 1 부터 시작하는 순위. 모르는 이름은 NaN."""
+        rank = self.label_index(labels) + 1.0
+        rank[rank == 0] = np.nan
+        return rank
+
+    def colors_for_index(self, idx):
+        """등급 번호 → (n, 4) uint8 RGBA 배열. -1 은 missing_color."""
+        palette = np.asarray(self.colors + (self.missing_color,), dtype="uint8")
+        return palette[np.asarray(idx)]   # -1 → 팔레트 마지막(missing_color)
+
+    def colors_for(self, values):
+        """값 → RGBA 배열."""
+        return self.colors_for_index(self.grade_index(values))
+
+    def color_map(self):
+        """plotly color_discrete_map 용 {등급: 'rgba(...)'}."""
+        return {
+            label: f"rgba({r},{g},{b},{a / 255:.2f})"
+            for label, (r, g, b, a) in zip(self.labels, self.colors)
+        }
+
+
+# 미세먼지(PM10) 환경부 예보 등급 (㎍/㎥)
+PM10_GRADES = GradeScale(
+    labels=("좋음", "보통", "나쁨", "매우나쁨"),
+    upper=(30, 80, 150, np.inf),
+    colors=(
+        (0, 128, 255, 160),     # 파랑
+        (0, 200, 0, 160),       # 초록
+        (255, 165, 0, 160),     # 주황
+        (255, 0, 0, 160),       # 빨강
+    ),
+)
+
+# 해안 플라스틱 폐기물 위험도 (범주형 척도)
+COASTAL_RISK = GradeScale(
+    labels=("Low", "Medium", "High", "Very_High"),
+    colors=(
+        (0, 128, 0, 255),       # green
+        (255, 165, 0, 255),     # orange
+        (255, 0, 0, 255),       # red
+        (139, 0, 0, 255),       # darkred
+    ),
+)
@@ -0,0 +1,91 @@
+# utils/columnar.py
+"""
+CSV → Arrow(IPC/Feather v2) 컬럼형 캐시
+
+CSV 를 처음 파싱하면 타입이 정해진 Arrow 파일을 CSV 옆 `.cache/` 폴더에 써 두고,
+다음 콜드 스타트부터는 그 파일을 memory-map 해서 읽습니다. (텍스트 토큰화 생략)
+
+전부 복사 없이 읽는 것은 아닙니다. to_pandas(split_blocks=True) 에서
+결측 없는 숫자 열만 mmap 버퍼를 그대로(읽기 전용) 쓰고, 문자열 · category · 결측 있는 열은
+pandas 객체로 새로 만듭니다. 즉 "복사 0" 이 아니라 "CSV 파싱 대신 빠른 역직렬화" 입니다.
+
+원본 CSV 의 mtime · 크기와 read_csv 옵션을 Arrow 스키마 메타데이터에 기록해 두므로,
+CSV 가 바뀌면 메타데이터가 맞지 않아 자동으로 다시 만들어집니다.
+"""
+import json
+import os
+from pathlib import Path
+
+import pyarrow as pa
+import pyarrow.ipc
+
+CACHE_DIR_NAME = ".cache"
+META_KEY = b"sdgs.source"
+FORMAT = 3                  # 저장 형식이 바뀌면 올림 (2: dtype 줄이기 적용, 3: 측정값 열은 그대로)
+
+
+def cache_path(csv_path):
+    """CSV 경로 → Arrow 캐시 파일 경로."""
+    csv_path = Path(csv_path)
+    return csv_path.parent / CACHE_DIR_NAME / (csv_path.name + ".arrow")
+
+
+def _signature(mtime_ns, size, read_kwargs):
+    return {
+        "format": FORMAT,
+        "mtime_ns": mtime_ns,
+        "size": size,
+        "read_kwargs": repr(read_kwargs),
+    }
+
+
+def read_cached(csv_path, mtime_ns, size, read_kwargs):
+    """
+    유효한 Arrow 캐시가 있으면 DataFrame 으로 돌려주고, 없거나 오래됐으면 None.
+    (결측 없는 숫자 열만 mmap 버퍼를 공유하고, 나머지 열은 복사됨)
+    """
+    arrow_path = cache_path(csv_path)
+    if not arrow_path.exists():
+        return None
+    try:
+        with pa.memory_map(str(arrow_path), "r") as source:
+            table = pa.ipc.open_file(source).read_all()
+    except (OSError, pa.ArrowException):
+        return None
+
+    meta = json.loads((table.schema.metadata or {}).get(META_KEY, b"{}"))
+    if meta.get("signature") != _signature(mtime_ns, size, read_kwargs):
+        return None
+
+    df = table.to_pandas(split_blocks=True)
+    df.attrs.update(meta.get("attrs", {}))
+    return df
+
+
+def write_cached(df, csv_path, mtime_ns, size, read_kwargs):
+    """
+    DataFrame 을 Arrow 캐시로 저장합니다.
+    쓰기 권한이 없거나 Arrow 로 바꿀 수 없는 열이 있으면 조용히 건너뜁니다.
+    """
+    arrow_path = cache_path(csv_path)
+    try:
+        table = pa.Table.from_pandas(df)
+    except (pa.ArrowException, TypeError, ValueError):
+        return False
+
+    meta = {"signature": _signature(mtime_ns, size, read_kwargs), "attrs": df.attrs}
+    metadata = dict(table.schema.metadata or {})
+    metadata[META_KEY] = json.dumps(meta, ensure_ascii=False).encode()
+    table = table.replace_schema_metadata(metadata)
+
+    tmp_path = arrow_path.with_name(f"{arrow_path.name}.{os.getpid()}.tmp")
+    try:
+        arrow_path.parent.mkdir(exist_ok=True)
+        with pa.OSFile(str(tmp_path), "wb") as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+        os.replace(tmp_path, arrow_path)    # 다른 프로세스가 반쯤 쓴 파일을 읽지 않도록
+    except OSError:
+        tmp_path.unlink(missing_ok=True)
+        return False
+    return True
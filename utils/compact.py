@@ -0,0 +1,88 @@
+# utils/compact.py
+"""
+불러온 프레임의 dtype 줄이기 (메모리 절약)
+
+CSV 를 기본 설정으로 읽으면 문자열은 object, 정수는 int64 가 됩니다.
+로더(utils/data.py)가 파싱 직후 한 번 이 단계를 거치고, 결과는 Arrow 캐시에도 그대로 저장됩니다.
+
+- 반복되는 문자열(지역 · 대륙 · 위험 등급 …) → category
+  (서로 다른 값의 비율이 CATEGORY_MAX_RATIO 이하인 열만. 고유한 이름 열은 그대로)
+- 연도 · id · code 처럼 열 이름이 KEY_COLUMN 에 맞는 정수 열 → int32
+- 측정값 열(농도 · 건수 · 면적 · 비율 …)은 int64 / float64 그대로 둠
+  페이지가 이 열로 비율 · 합계 등을 계산하는데, 작은 정수형은 계산 중 조용히 넘칠(wrap) 수 있고
+  float32 는 31.3 → 31.299999… 처럼 값이 바뀌어 차트에 그대로 보이기 때문
+
+그래서 줄어드는 것은 문자열 열(category)과 키 열뿐입니다. 숫자만 있는 표
+(미세먼지 · 고용률 · 월별 산불 …)는 거의 줄지 않으며, 이 앱의 CSV 는 모두 수 KB ~ 수백 KB 라
+측정값 열까지 줄여 얻을 메모리보다 넘침 위험이 더 큽니다.
+
+줄어든 메모리는 df.attrs["memory"] 에 남고(Arrow 캐시 · 번들에도 함께 저장),
+로더가 remember() 로 모아 두면 성능 디버그 패널(?debug=1)에 표로 보입니다.
+"""
+import re
+import threading
+
+import numpy as np
+import pandas as pd
+
+CATEGORY_MAX_RATIO = 0.5
+KEY_COLUMN = re.compile(r"^(year|연도|년도|id|code)$", re.IGNORECASE)
+
+_reports = {}                       # 표 이름 → {"before", "after"} (바이트)
+_reports_lock = threading.Lock()
+
+
+def _compact_key(series):
+    values = series.to_numpy()
+    info = np.iinfo(np.int32)
+    if info.min <= values.min() and values.max() <= info.max:
+        return series.astype(np.int32)
+    return series
+
+
+def _compact_column(name, series):
+    if len(series) == 0:
+        return series
+    if pd.api.types.is_bool_dtype(series):
+        return series
+    if pd.api.types.is_integer_dtype(series):
+        if KEY_COLUMN.match(str(name).strip()):
+            return _compact_key(series)
+        return series
+    if pd.api.types.is_object_dtype(series):
+        non_null = series.dropna()
+        if len(non_null) and non_null.map(type).eq(str).all():
+            if series.nunique() <= CATEGORY_MAX_RATIO * len(series):
+                return series.astype("category")
+    return series
+
+
+def compact_frame(df):
+    """dtype 을 줄인 새 DataFrame 을 돌려줍니다. attrs 는 그대로 두고 "memory" 를 더함."""
+    before = int(df.memory_usage(deep=True).sum())
+    saved = 0
+    out = df.copy(deep=False)
+    for col in df.columns:
+        compacted = _compact_column(col, df[col])
+        if compacted.dtype != df[col].dtype:
+            out[col] = compacted
+            # 바뀐 열만 비교 (문자열 객체 크기는 잴 때마다 조금씩 달라질 수 있어 전체를 다시 재지 않음)
+            saved += df[col].memory_usage(deep=True, index=False) - compacted.memory_usage(deep=True, index=False)
+    after = before - int(saved)
+
+    out.attrs["memory"] = {"before": before, "after": after}
+    return out
+
+
+def remember(name, df):
+    """df.attrs["memory"] 를 표 이름으로 기록합니다. (번들 · Arrow 캐시에서 읽은 표도)"""
+    memory = df.attrs.get("memory")
+    if memory:
+        with _reports_lock:
+            _reports[name] = memory
+
+
+def memory_report():
+    """이 프로세스가 불러온 표들의 [(이름, 줄이기 전 바이트, 후 바이트)], 이름 순."""
+    with _reports_lock:
+        return [(name, m["before"], m["after"]) for name, m in sorted(_reports.items())]
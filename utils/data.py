@@ -0,0 +1,217 @@
+# utils/data.py
+"""
+공용 데이터 로더
+
+모든 페이지가 같은 CSV 를 불러올 때 이 모듈을 거치도록 합니다.
+파싱 결과는 (절대경로, 수정시각, 파일 크기) 를 키로 프로세스 전체에서 한 번만
+만들어 두고, 모든 rerun · 모든 세션에 **같은 DataFrame 객체**를 돌려줍니다.
+파일이 바뀌면 키가 달라지므로 자동으로 다시 읽습니다.
+새 프로세스에서는 데이터 번들(utils/bundle.py) → CSV 옆 Arrow 캐시(utils/columnar.py)
+→ CSV 순서로 찾아 씁니다. 번들은 원본 CSV 와 내용이 같을 때만 쓰입니다.
+
+반환되는 프레임은 공유 원본의 복사 없는 뷰(utils/shared.py)이므로,
+열을 추가 · 수정해도 다른 세션에는 영향이 없습니다. (`.copy()` 불필요)
+"""
+import hashlib
+import io
+import threading
+from collections import defaultdict
+from pathlib import Path
+
+import pandas as pd
+import streamlit as st
+
+from utils import bootstrap, columnar
+from utils.bundle import entry_name, open_bundle
+from utils.compact import compact_frame, remember
+from utils.encoding import detect_encoding
+from utils.profiling import span
+from utils.shared import view
+
+bootstrap.configure()           # 공유 프레임을 만들기 전에 Copy-on-Write 켜기
+
+# 프로젝트 루트 (main.py 가 있는 폴더)
+ROOT = Path(__file__).resolve().parent.parent
+
+# CSV 를 찾아볼 폴더 (앞에 있을수록 우선)
+DATA_DIRS = [ROOT, ROOT / "pages"]
+
+
+def _bundled(path):
+    """path 의 번들 원본 정보 {sha256, size, mtime_ns} (번들이 없거나 항목이 없으면 None)."""
+    bundle = open_bundle()
+    return bundle.source(entry_name(path)) if bundle else None
+
+
+def data_path(name):
+    """
+    파일 이름 → 실제 경로. 디스크에 없으면 번들 manifest 에서 찾고,
+    그래도 없으면 루트 기준 경로를 그대로 돌려줍니다. (실행 폴더와 무관)
+    """
+    path = Path(name)
+    if path.is_absolute():
+        return path
+    for folder in DATA_DIRS:
+        candidate = folder / path
+        if candidate.exists():
+            return candidate.resolve()
+    for folder in DATA_DIRS:
+        candidate = (folder / path).resolve()
+        if _bundled(candidate):
+            return candidate
+    return (ROOT / path).resolve()
+
+
+def available(name):
+    """디스크나 번들에 그 파일이 있는지."""
+    path = data_path(name)
+    return path.exists() or _bundled(path) is not None
+
+
+def file_key(path):
+    """캐시 키로 쓰는 (절대경로, mtime_ns, 크기). 번들에만 있는 파일은 manifest 값."""
+    path = Path(path).resolve()
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        source = _bundled(path)
+        if source is None:
+            raise
+        return str(path), source["mtime_ns"], source["size"]
+    return str(path), stat.st_mtime_ns, stat.st_size
+
+
+# 파일 경로 → 그 파일에 기대는 캐시 호출 {(함수 이름, 인자 repr): (캐시 함수, 인자)}
+# 파일이 바뀌면 utils/watch.py 가 이 항목들만 골라 지웁니다.
+_dependents = defaultdict(dict)
+_seen_hashes = defaultdict(set)     # 파일 경로 → 계산했던 내용 해시들 (차트 캐시 정리용)
+_deps_lock = threading.Lock()
+
+
+def tracked(name, cached_func, *args):
+    """
+    파일 name 에 기대는 캐시 함수를 cached_func(path, mtime_ns, size, *args) 로 부르고,
+    그 호출을 파일의 의존 목록에 기록합니다. (파일이 바뀌면 utils/watch.py 가 이 호출만 지움)
+    파일에서 만드는 st.cache_resource 함수는 모두 이것으로 부릅니다.
+    앞의 세 인자(path · mtime_ns · size)는 캐시 키로, 파일이 바뀌면 새 항목이 만들어집니다.
+
+    예) tracked("energy.csv", _parse_file, read_kwargs)
+    """
+    path, mtime_ns, size = file_key(data_path(name))
+    return _track(path, cached_func, path, mtime_ns, size, *args)
+
+
+def _track(path, cached_func, *args):
+    from utils.watch import start_watcher       # 첫 데이터 접근 때 감시 시작 (순환 import 방지)
+
+    start_watcher()
+    with _deps_lock:
+        _dependents[str(path)][(cached_func.__qualname__, repr(args))] = (cached_func, args)
+    return cached_func(*args)
+
+
+def forget(path):
+    """path 에 기대던 캐시 호출 목록과 내용 해시들을 꺼내고 기록을 비웁니다."""
+    with _deps_lock:
+        calls = list(_dependents.pop(str(path), {}).values())
+        hashes = _seen_hashes.pop(str(path), set())
+    return calls, hashes
+
+
+def _read(source, sniff_source, read_kwargs):
+    """
+    인코딩을 먼저 감지한 뒤 한 번만 파싱하고, dtype 을 줄입니다(utils/compact.py).
+    감지한 인코딩은 df.attrs["encoding"] 에 남겨, 화면 표시는 캐시 밖에서 하도록 합니다.
+    """
+    kwargs = dict(read_kwargs)
+    if "encoding" not in kwargs:
+        kwargs["encoding"] = detect_encoding(sniff_source)
+        if kwargs["encoding"] is None:
+            raise UnicodeError("파일 인코딩을 감지하지 못했습니다.")
+    df = compact_frame(pd.read_csv(source, **kwargs))
+    df.attrs["encoding"] = kwargs["encoding"]
+    return df
+
+
+@st.cache_resource(show_spinner=False, max_entries=256)
+def _hash_file(path, mtime_ns, size):
+    if not Path(path).exists():             # 번들에만 있는 파일
+        digest = _bundled(path)["sha256"]
+    else:
+        sha = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                sha.update(chunk)
+        digest = sha.hexdigest()
+    with _deps_lock:
+        _seen_hashes[path].add(digest)      # 파일이 바뀌면 이 해시가 든 차트를 지움
+    return digest
+
+
+@span("load")
+def content_hash(name):
+    """파일 내용의 SHA-256 (파일 버전마다 한 번만 계산)."""
+    return tracked(name, _hash_file)
+
+
+def _from_bundle(path, mtime_ns, size, read_kwargs):
+    # 번들의 원본과 지금 파일이 같을 때만 (크기 · mtime 이 같거나, 크기가 같고 내용 해시가 같음)
+    source = _bundled(path)
+    if source is None or source["size"] != size:
+        return None
+    if source["mtime_ns"] != mtime_ns and source["sha256"] != _hash_file(path, mtime_ns, size):
+        return None
+    return open_bundle().table(entry_name(path), read_kwargs)
+
+
+@st.cache_resource(show_spinner=False, max_entries=64)
+def _parse_file(path, mtime_ns, size, read_kwargs):
+    # 1) 데이터 번들에 같은 내용의 표가 있으면 그것을 (memory-map, 복사 없음)
+    df = _from_bundle(path, mtime_ns, size, read_kwargs)
+    if df is None:
+        # 2) 콜드 스타트: Arrow 캐시가 유효하면 memory-map 으로 바로 읽기
+        df = columnar.read_cached(path, mtime_ns, size, read_kwargs)
+    if df is None:
+        # 3) 없거나 CSV 가 바뀌었으면 CSV 를 파싱하고 Arrow 캐시를 새로 씀
+        df = _read(path, path, read_kwargs)
+        columnar.write_cached(df, path, mtime_ns, size, read_kwargs)
+    remember(entry_name(path), df)      # dtype 줄이기 결과 (성능 디버그 패널)
+    return df
+
+
+@st.cache_resource(show_spinner=False, max_entries=16)
+def _parse_bytes(data, read_kwargs):
+    return _read(io.BytesIO(data), data, read_kwargs)
+
+
+@span("load")
+def load_csv(name, **read_kwargs):
+    """
+    CSV 를 읽어 공유 DataFrame 의 뷰를 돌려줍니다.
+
+    name        : 파일 이름(루트·pages 폴더에서 검색) 또는 경로
+    read_kwargs : pd.read_csv 에 그대로 전달할 옵션
+                  (encoding 을 주지 않으면 자동 감지)
+    """
+    read_kwargs = tuple(sorted(read_kwargs.items()))
+    return view(tracked(name, _parse_file, read_kwargs))
+
+
+@span("load")
+def load_upload(uploaded, **read_kwargs):
+    """st.file_uploader 로 받은 파일을 내용 기준으로 캐시해 읽습니다."""
+    return view(_parse_bytes(uploaded.getvalue(), tuple(sorted(read_kwargs.items()))))
+
+
+@span("load")
+def read_csv(name, **read_kwargs):
+    """
+    페이지용 도우미: 프로젝트에 든 파일이 있으면 그것을, 없으면 업로드 받은 파일을 읽습니다.
+    둘 다 없으면 페이지 실행을 멈춥니다.
+    """
+    if available(name):
+        return load_csv(name, **read_kwargs)
+    upl = st.file_uploader(f"⬆️ {name} 업로드", type="csv", key=name)
+    if upl is not None:
+        return load_upload(upl, **read_kwargs)
+    st.stop()
@@ -0,0 +1,91 @@
+# utils/decimate.py
+"""
+선 그래프용 시계열 솎아내기(decimation)
+
+브라우저로 보내는 점 수를 차트의 가로 픽셀 수에 맞춰 줄이면서 봉우리 · 골짜기는 남깁니다.
+
+- lttb             : Largest-Triangle-Three-Buckets (모양 보존이 좋음, 메모리 안의 배열용)
+- minmax_indices   : 구간마다 최솟값 · 최댓값 두 점 (극값을 반드시 보존)
+- decimate_frame   : 확대 범위 자르기 + 픽셀 폭에 맞춘 솎아내기를 한 번에
+
+차트마다 폭이 다르므로 폭(px)은 부르는 쪽이 차트 레이아웃에 맞춰 넘깁니다.
+"""
+import numpy as np
+import pandas as pd
+
+from utils.profiling import span
+
+def target_points(width_px, points_per_px=0.5, minimum=50):
+    """차트 폭(px) → 보낼 점 개수."""
+    return max(minimum, int(width_px * points_per_px))
+
+
+def lttb(x, y, n_out):
+    """
+    LTTB 로 고른 점들의 인덱스 (오름차순). x 는 정렬돼 있어야 합니다.
+    n_out 이 점 개수 이상이면 전부 돌려줍니다.
+    """
+    x = np.asarray(x, dtype="float64")
+    y = np.asarray(y, dtype="float64")
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    # 첫 점 · 마지막 점을 뺀 나머지를 n_out - 2 개 구간으로
+    edges = np.linspace(1, n - 1, n_out - 1).astype("int64")
+    # 각 구간의 평균점 (다음 구간 평균 계산용) — 누적합으로 한 번에
+    cx = np.concatenate([[0.0], np.cumsum(x)])
+    cy = np.concatenate([[0.0], np.cumsum(y)])
+    lo, hi = edges[:-1], edges[1:]
+    avg_x = (cx[hi] - cx[lo]) / (hi - lo)
+    avg_y = (cy[hi] - cy[lo]) / (hi - lo)
+    avg_x = np.append(avg_x[1:], x[-1])     # i 번째 구간에서 본 "다음 구간" 평균
+    avg_y = np.append(avg_y[1:], y[-1])
+
+    picked = np.empty(n_out, dtype="int64")
+    picked[0], picked[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        seg = slice(lo[i], hi[i])
+        # 이전 선택점 a, 이번 구간 후보, 다음 구간 평균이 이루는 삼각형 넓이
+        area = np.abs(
+            (x[a] - avg_x[i]) * (y[seg] - y[a]) - (x[a] - x[seg]) * (avg_y[i] - y[a])
+        )
+        a = lo[i] + int(np.argmax(area))
+        picked[i + 1] = a
+    return picked
+
+
+def _bucket_of(x, x_min, x_max, n_buckets):
+    span = (x_max - x_min) or 1.0
+    b = ((np.asarray(x, dtype="float64") - x_min) / span * n_buckets).astype("int64")
+    return np.clip(b, 0, n_buckets - 1)
+
+
+def minmax_indices(x, y, n_buckets, x_range=None):
+    """구간마다 최솟값 · 최댓값 점의 인덱스 (x 순 정렬, 중복 제거)."""
+    x = np.asarray(x, dtype="float64")
+    y = np.asarray(y, dtype="float64")
+    if len(x) <= 2 * n_buckets:
+        return np.arange(len(x))
+    x_min, x_max = x_range if x_range is not None else (x.min(), x.max())
+    buckets = pd.Series(y).groupby(_bucket_of(x, x_min, x_max, n_buckets))
+    idx = np.union1d(buckets.idxmin().dropna(), buckets.idxmax().dropna()).astype("int64")
+    return idx[np.argsort(x[idx], kind="stable")]
+
+
+@span("transform")
+def decimate_frame(df, x, y, width_px, x_range=None, method="lttb", points_per_px=0.5):
+    """
+    df 를 확대 범위(x_range)로 자른 뒤 y 열 기준으로 차트 폭에 맞게 솎아낸 행들을 돌려줍니다.
+    width_px : 그 차트의 가로 폭(px)
+    method   : "lttb" 또는 "minmax"
+    """
+    if x_range is not None:
+        df = df[(df[x] >= x_range[0]) & (df[x] <= x_range[1])]
+    n_out = target_points(width_px, points_per_px)
+    if method == "minmax":
+        idx = minmax_indices(df[x], df[y], max(1, n_out // 2), x_range)
+    else:
+        idx = lttb(df[x], df[y], n_out)
+    return df.iloc[idx]
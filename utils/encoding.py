@@ -0,0 +1,78 @@
+# utils/encoding.py
+"""
+CSV 인코딩 감지
+
+파일 앞부분(최대 `MAX_SNIFF_BYTES`)만 읽어 BOM 을 확인하고 후보 코덱으로
+시험 디코딩해 본 뒤, 실제 파싱은 고른 코덱으로 **한 번만** 하도록 합니다.
+(예전처럼 인코딩마다 pd.read_csv 를 통째로 다시 돌리지 않습니다.)
+"""
+import codecs
+from pathlib import Path
+
+# BOM → 코덱 (긴 BOM 부터 검사)
+BOMS = [
+    (codecs.BOM_UTF32_LE, "utf-32"),
+    (codecs.BOM_UTF32_BE, "utf-32"),
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+]
+
+# 시험 디코딩 순서. cp949 는 euc-kr 의 상위 집합이라 euc-kr 파일도 읽습니다.
+CANDIDATES = ["utf-8", "cp949"]
+
+CHUNK_BYTES = 64 * 1024
+MAX_SNIFF_BYTES = 1024 * 1024
+
+
+def _read_prefix(source):
+    """경로·bytes·파일 객체에서 판단에 필요한 만큼만 앞부분을 가져옵니다."""
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return bytes(source[:MAX_SNIFF_BYTES])
+    if isinstance(source, (str, Path)):
+        with open(source, "rb") as f:
+            return _read_until_non_ascii(f)
+    # 업로드 파일 등 파일 객체: 읽은 뒤 위치를 되돌려 둡니다.
+    pos = source.tell()
+    try:
+        return _read_until_non_ascii(source)
+    finally:
+        source.seek(pos)
+
+
+def _read_until_non_ascii(f):
+    # ASCII 만으로는 코덱을 가를 수 없으므로, 비 ASCII 바이트가 나올 때까지
+    # 청크 단위로 더 읽습니다. (최대 MAX_SNIFF_BYTES)
+    buf = b""
+    while len(buf) < MAX_SNIFF_BYTES:
+        chunk = f.read(CHUNK_BYTES)
+        if not chunk:
+            break
+        buf += chunk
+        if not chunk.isascii():
+            break
+    return buf
+
+
+def _decodes(data, encoding):
+    # final=False: 앞부분을 자르다 끊긴 멀티바이트 문자는 오류로 보지 않음
+    try:
+        codecs.getincrementaldecoder(encoding)().decode(data, final=False)
+        return True
+    except UnicodeDecodeError:
+        return False
+
+
+def detect_encoding(source):
+    """
+    source(경로 · bytes · 파일 객체)의 인코딩 이름을 돌려줍니다.
+    어느 후보로도 디코딩되지 않으면 None.
+    """
+    prefix = _read_prefix(source)
+    for bom, encoding in BOMS:
+        if prefix.startswith(bom):
+            return encoding
+    for encoding in CANDIDATES:
+        if _decodes(prefix, encoding):
+            return encoding
+    return None
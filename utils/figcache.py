@@ -0,0 +1,280 @@
+# utils/figcache.py
+"""
+차트(Figure) 캐시
+
+같은 데이터 · 같은 위젯 값이면 같은 차트가 나오므로, 만들어 둔 차트를
+(데이터 내용 해시, 차트 id, 관련 위젯 값, 그리는 함수의 코드) 를 키로 저장해
+모든 세션이 함께 씁니다. 다른 학생이 같은 화면을 보면 dict 조회 한 번이면 됩니다.
+
+- LRU 방식, 전체 용량 상한(`FIGURE_CACHE_MB`, 기본 64MB)을 넘으면 오래된 것부터 버림
+- 용량은 차트 spec(JSON)의 크기로 계산
+- Streamlit 에는 미리 직렬화한 spec 을 바로 보내는 공개 API 가 없어,
+  항목에는 완성된 Figure 객체를 저장합니다. (st.plotly_chart 등은 인자를 바꾸지 않음)
+
+⚠️ 돌려받은 차트를 수정하지 마세요. update_layout 등은 build 함수 안에서 끝내야 합니다.
+⚠️ 차트에 영향을 주는 값(위젯 값, 그 값으로 거른 표 …)은 모두 params 로 넘기세요.
+   build 가 바깥 변수(페이지 전역 · 클로저)나 도우미 함수를 읽으면 그 값과 코드도 키에 넣지만,
+   내용을 해시할 수 없는 값을 읽는 build 는 캐시하지 않고 매번 새로 그립니다.
+"""
+import dataclasses
+import hashlib
+import json
+import logging
+import os
+import threading
+import types
+import weakref
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from utils.data import available, content_hash
+from utils.profiling import span
+
+DEFAULT_MAX_MB = float(os.environ.get("FIGURE_CACHE_MB", 64))
+
+logger = logging.getLogger(__name__)
+
+
+class FigureCache:
+    """스레드 안전한 LRU 캐시 (용량 상한: 바이트). 값은 차트 객체나 이미지 바이트."""
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self._items = OrderedDict()         # key → (figure, size)
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = self.misses = 0
+
+    def get(self, key):
+        with self._lock:
+            item = self._items.get(key)
+            if item is None:
+                self.misses += 1
+                return None
+            self._items.move_to_end(key)
+            self.hits += 1
+            return item[0]
+
+    def put(self, key, figure, size):
+        with self._lock:
+            if key in self._items:
+                self._bytes -= self._items.pop(key)[1]
+            if size > self.max_bytes:       # 상한보다 큰 차트는 저장하지 않음
+                return
+            self._items[key] = (figure, size)
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                _, (_, old_size) = self._items.popitem(last=False)
+                self._bytes -= old_size
+
+    def discard(self, predicate):
+        """predicate(key) 가 참인 항목을 지웁니다."""
+        with self._lock:
+            for key in [k for k in self._items if predicate(k)]:
+                self._bytes -= self._items.pop(key)[1]
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+            self._bytes = 0
+
+    def stats(self):
+        with self._lock:
+            return {"entries": len(self._items), "bytes": self._bytes,
+                    "max_bytes": self.max_bytes, "hits": self.hits, "misses": self.misses}
+
+
+@st.cache_resource(show_spinner=False)
+def figure_cache():
+    """프로세스 전체가 함께 쓰는 차트 캐시."""
+    return FigureCache(int(DEFAULT_MAX_MB * 1024 * 1024))
+
+
+def spec_size(figure):
+    """차트 spec(JSON) 의 바이트 수 (Plotly · Altair · pydeck)."""
+    if hasattr(figure, "to_plotly_json"):
+        import plotly.io as pio
+        return len(pio.to_json(figure, validate=False))
+    if hasattr(figure, "to_json"):
+        return len(figure.to_json())
+    return len(json.dumps(figure, default=str))
+
+
+def _freeze(value):
+    # 위젯 값(list · dict 등)을 캐시 키로 쓸 수 있게 변환
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple, set)):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def _code_hash(code):
+    # 그리는 함수의 코드가 바뀌면(개발 중 수정 등) 예전 차트를 쓰지 않도록.
+    # 페이지는 rerun 마다 함수를 새로 만들므로 객체 주소가 아닌 내용으로 계산
+    digest = hashlib.sha1(code.co_code)
+    digest.update(repr(code.co_names).encode())
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            digest.update(_code_hash(const).encode())
+        else:
+            digest.update(repr(const).encode())
+    return digest.hexdigest()[:16]
+
+
+_dataclass_memo = {}                    # id(객체) → (weakref, 해시)
+_memo_lock = threading.Lock()
+
+
+class _Unhashable(Exception):
+    """build 가 읽는 바깥 값 중 내용으로 해시할 수 없는 것이 있음."""
+
+
+def _global_names(code):
+    # 중첩 함수(lambda 등)가 읽는 이름까지
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            names |= _global_names(const)
+    return names
+
+
+def _free_values(func):
+    """func 가 읽는 바깥 값: 전역 변수 · 클로저 변수 · 기본 인자."""
+    for name in sorted(_global_names(func.__code__)):
+        if name in func.__globals__:
+            yield name, func.__globals__[name]
+    for name, cell in zip(func.__code__.co_freevars, func.__closure__ or ()):
+        try:
+            yield name, cell.cell_contents
+        except ValueError:              # 아직 값이 정해지지 않은 클로저 변수
+            yield name, None
+    yield "__defaults__", func.__defaults__
+    yield "__kwdefaults__", func.__kwdefaults__
+
+
+def _fingerprint(value, digest, seen, module):
+    if value is None or isinstance(value, (bool, int, float, complex, str, bytes)):
+        digest.update(repr(value).encode())
+    elif isinstance(value, (types.ModuleType, type, types.BuiltinFunctionType)):
+        # 모듈 · 클래스 · 내장 함수는 이름으로 (내용은 앱을 다시 띄울 때만 바뀜)
+        digest.update(f"{getattr(value, '__module__', '')}.{value.__name__}".encode())
+    elif isinstance(value, types.FunctionType) and value.__module__ != module:
+        # 다른 모듈(utils 등)의 함수도 이름으로. 페이지 안의 도우미 함수만 코드 · 바깥 값까지 봄
+        digest.update(f"{value.__module__}.{value.__qualname__}".encode())
+    elif isinstance(value, types.FunctionType):
+        if id(value) in seen:           # 재귀 함수
+            return
+        seen.add(id(value))
+        digest.update(_code_hash(value.__code__).encode())
+        for name, inner in _free_values(value):
+            digest.update(name.encode())
+            _fingerprint(inner, digest, seen, module)
+    elif isinstance(value, types.MethodType):
+        digest.update(value.__func__.__qualname__.encode())
+        _fingerprint(value.__self__, digest, seen, module)
+    elif isinstance(value, dict):
+        for k in sorted(value, key=repr):
+            digest.update(repr(k).encode())
+            _fingerprint(value[k], digest, seen, module)
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        digest.update(type(value).__name__.encode())
+        for item in sorted(value, key=repr) if isinstance(value, (set, frozenset)) else value:
+            _fingerprint(item, digest, seen, module)
+    elif isinstance(value, (pd.DataFrame, pd.Series, pd.Index)):
+        digest.update(repr((getattr(value, "columns", None), value.dtypes, value.shape)).encode())
+        try:
+            digest.update(pd.util.hash_pandas_object(value, index=True).to_numpy().tobytes())
+        except TypeError as e:           # list 등 해시할 수 없는 값이 든 열
+            raise _Unhashable(type(value).__name__) from e
+    elif isinstance(value, np.ndarray):
+        digest.update(repr((value.dtype, value.shape)).encode())
+        if value.dtype == object:
+            _fingerprint(pd.Series(value.ravel()), digest, seen, module)
+        else:
+            digest.update(np.ascontiguousarray(value).tobytes())
+    elif isinstance(value, np.generic):
+        digest.update(repr(value).encode())
+    elif dataclasses.is_dataclass(value):
+        # TidyView · StationStore · GradeScale 처럼 필드가 곧 내용인 객체
+        digest.update(_dataclass_hash(value, module).encode())
+    else:
+        raise _Unhashable(type(value).__name__)
+
+
+def _dataclass_hash(value, module):
+    # 바꿀 수 없는(frozen) 객체는 파일마다 한 번 만들어 모든 세션 · rerun 이 같은 객체를 쓰므로
+    # 객체별로 한 번만 해시 (큰 프레임을 rerun 마다 다시 해시하지 않게)
+    frozen = value.__dataclass_params__.frozen
+    if frozen:
+        with _memo_lock:
+            memo = _dataclass_memo.get(id(value))
+        if memo is not None and memo[0]() is value:
+            return memo[1]
+    digest = hashlib.sha1(type(value).__qualname__.encode())
+    for field in dataclasses.fields(value):
+        digest.update(field.name.encode())
+        _fingerprint(getattr(value, field.name), digest, set(), module)
+    result = digest.hexdigest()
+    if frozen:
+        try:
+            ref = weakref.ref(value, lambda _, key=id(value): _dataclass_memo.pop(key, None))
+        except TypeError:               # __slots__ 로 weakref 를 막은 클래스
+            return result
+        with _memo_lock:
+            _dataclass_memo[id(value)] = (ref, result)
+    return result
+
+
+def _build_hash(build):
+    """build 의 코드 + 읽는 바깥 값(전역 · 클로저 · 도우미 함수)의 해시. 해시할 수 없으면 _Unhashable."""
+    digest = hashlib.sha1()
+    _fingerprint(build, digest, set(), build.__module__)
+    return digest.hexdigest()[:16]
+
+
+def figure_key(chart_id, datasets, build, params):
+    """
+    캐시 키를 만듭니다. 데이터 파일이 없어 해시를 구할 수 없거나,
+    build 가 내용으로 해시할 수 없는 바깥 값을 읽으면 None.
+    (이미지 캐시 등 다른 저장 형식도 같은 키 규칙을 쓰도록 분리)
+    """
+    if not all(available(name) for name in datasets):
+        return None
+    try:
+        build_hash = _build_hash(build)
+    except _Unhashable as e:
+        logger.warning("%s: build 가 해시할 수 없는 값(%s)을 읽어 캐시하지 않습니다. params 로 넘기세요.",
+                       chart_id, e)
+        return None
+    return (
+        chart_id,
+        tuple(content_hash(name) for name in datasets),
+        _freeze(params),
+        build_hash,
+    )
+
+
+@span("figure")
+def cached_figure(chart_id, datasets, build, **params):
+    """
+    build(**params) 로 만든 차트를 캐시해 돌려줍니다.
+
+    chart_id : 차트 이름 (페이지 안에서 고유하게, 예: "plastic.top10")
+    datasets : 차트가 쓰는 데이터 파일 이름 목록 (내용 해시가 키에 들어감)
+    params   : 차트에 영향을 주는 위젯 값 (build 가 쓰는 값은 모두 여기로 넘기기)
+
+    파일이 없어 업로드로 받은 경우 등 데이터 해시를 구할 수 없으면 캐시하지 않습니다.
+    """
+    key = figure_key(chart_id, datasets, build, params)
+    if key is None:
+        return build(**params)
+    cache = figure_cache()
+    figure = cache.get(key)
+    if figure is None:
+        figure = build(**params)
+        cache.put(key, figure, spec_size(figure))
+    return figure
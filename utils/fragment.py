@@ -0,0 +1,30 @@
+# utils/fragment.py
+"""
+세션이 없어도 실행되는 st.fragment
+
+st.fragment 로 감싼 함수는 ScriptRunContext 가 없는 스레드(예열 스레드 · runpy)에서 부르면
+본문을 실행하지 않고 None 을 돌려줍니다. 그러면 fragment 안의 차트가 예열되지 않으므로,
+부를 때 세션이 없으면 감싸지 않은 원래 함수를 그대로 실행합니다.
+
+    @fragment
+    def year_section():
+        ...
+"""
+import functools
+
+import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+
+def fragment(func=None, **kwargs):
+    """st.fragment 와 같은 사용법. 세션이 없으면 fragment 없이 func 를 바로 실행."""
+    if func is None:
+        return lambda f: fragment(f, **kwargs)
+    wrapped = st.fragment(func, **kwargs)
+
+    @functools.wraps(func)
+    def run(*args, **kw):
+        if get_script_run_ctx(suppress_warning=True) is None:
+            return func(*args, **kw)
+        return wrapped(*args, **kw)
+    return run
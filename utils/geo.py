@@ -0,0 +1,91 @@
+# utils/geo.py
+"""
+공용 지명 사전(gazetteer)
+
+- gazetteer_kr_regions.csv : 시·도 17곳 (행정구역 코드, 중심 좌표, "서울" 같은 약칭)
+- gazetteer_countries.csv  : ISO 국가 (ISO3/ISO2, 영문·한글 이름, 중심 좌표, 별칭)
+
+이름 · 코드 · 별칭을 모두 정규화한 키로 한 번만 색인해 두고,
+페이지는 `attach_coords` 로 열 전체에 좌표를 한 번에 붙입니다. (행마다 lambda 없음)
+"""
+import pandas as pd
+import streamlit as st
+
+from utils.data import load_csv, tracked
+from utils.profiling import span
+
+GAZETTEERS = {
+    "kr_region": {
+        "file": "gazetteer_kr_regions.csv",
+        "key_cols": ["name", "code"],
+    },
+    "country": {
+        "file": "gazetteer_countries.csv",
+        "key_cols": ["name", "name_ko", "iso3", "iso2"],
+    },
+}
+# "NA"(나미비아) 같은 코드가 결측으로 읽히지 않도록 keep_default_na=False
+READ_OPTIONS = {"keep_default_na": False, "dtype": {"code": "str"}}
+
+
+def normalize(names):
+    """대소문자 · 유니코드 표기 · 공백 · 마침표 차이를 무시하는 비교용 키."""
+    names = pd.Series(names, dtype="object").astype("string")
+    return (
+        names.str.normalize("NFKC")
+        .str.casefold()
+        .str.replace(".", "", regex=False)
+        .str.replace(r"\s+", " ", regex=True)
+        .str.strip()
+    )
+
+
+@st.cache_resource(show_spinner=False)
+def _alias_index(path, mtime_ns, size, kind):
+    spec = GAZETTEERS[kind]
+    table = load_csv(path, **READ_OPTIONS)
+    table["row"] = range(len(table))
+
+    # 이름 · 코드 · 별칭("|" 구분)을 모두 (키 → 행 번호) 로 펼치기
+    keys = [table[[col, "row"]].rename(columns={col: "key"}) for col in spec["key_cols"]]
+    aliases = table[["aliases", "row"]].assign(key=table["aliases"].str.split("|"))
+    keys.append(aliases.explode("key")[["key", "row"]])
+    keys = pd.concat(keys, ignore_index=True)
+    keys["key"] = normalize(keys["key"])
+    keys = keys[keys["key"].fillna("") != ""]
+
+    dup = keys.drop_duplicates().duplicated("key", keep=False)
+    if dup.any():
+        raise ValueError(f"{spec['file']}: 여러 행을 가리키는 별칭 {sorted(keys.loc[dup, 'key'])}")
+    index = keys.drop_duplicates("key").set_index("key")["row"]
+    # 마지막에 빈 행을 하나 붙여, 찾지 못한 이름(-1)이 그 행을 가리키게 함
+    table = table.drop(columns=["row", "aliases"])
+    table = table.reindex(range(len(table) + 1))
+    return table, index
+
+
+def gazetteer(kind):
+    """(사전 테이블, 정규화 키 → 행 번호 Series)."""
+    table, index = tracked(GAZETTEERS[kind]["file"], _alias_index, kind)
+    return table.iloc[:-1], index
+
+
+@span("transform")
+def locate(names, kind):
+    """
+    이름 목록 → 사전 행들 (입력과 같은 길이 · 순서). 찾지 못한 이름은 모든 열이 NaN.
+    kind : "kr_region" 또는 "country"
+    """
+    table, index = tracked(GAZETTEERS[kind]["file"], _alias_index, kind)
+    rows = index.reindex(normalize(names)).fillna(-1).astype("int64").to_numpy()
+    return table.iloc[rows].reset_index(drop=True)
+
+
+@span("transform")
+def attach_coords(df, column, kind, fields=("lat", "lon")):
+    """
+    df[column] 의 지명으로 사전 열(기본: lat, lon)을 붙인 새 DataFrame 을 돌려줍니다.
+    예) attach_coords(df, "Country", "country", fields=("lat", "lon", "iso3"))
+    """
+    found = locate(df[column], kind)
+    return df.assign(**{field: found[field].to_numpy() for field in fields})
@@ -0,0 +1,97 @@
+# utils/kosis.py
+"""
+KOSIS(국가통계포털) 내려받기 파일 정리
+
+KOSIS CSV 는 숫자를 "1,007" 처럼 천 단위 쉼표로 쓰고, 값이 없으면 "-", "…", "x" 를 넣으며,
+연도를 열(가로)로 펼쳐 둔 경우가 많습니다. 여기서는 이를 파싱 단계에서 한 번에 정리합니다.
+
+- 천 단위 쉼표 · 빈칸 표시는 pd.read_csv 옵션(thousands, na_values)으로 C 파서가 처리
+  → 칸마다 파이썬 함수를 부르지 않음
+- 그래도 문자열로 남은 열은 "%" · 공백을 벡터 연산으로 지우고, 모두 숫자일 때만 숫자로 바꿈
+- 연도가 열 이름인 표(예: born baby.csv, employmentrate.csv)는 연도가 행이 되도록 뒤집음
+
+예) df = read_kosis("employmentrate.csv")   # [연도, 생산가능인구, 경제활동인구, …]
+"""
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from utils.compact import compact_frame
+from utils.data import available, load_csv, read_csv, tracked
+from utils.profiling import span
+from utils.shared import view
+
+PLACEHOLDERS = ["-", "…", "...", "x", "X"]      # 통계 없음 · 비밀보호 등
+READ_OPTIONS = {"thousands": ",", "na_values": PLACEHOLDERS}
+YEAR_PATTERN = r"^\d{4}$"
+
+
+def to_numbers(df):
+    """문자열로 남은 숫자 열(예: "12.5%")을 숫자로 바꾼 새 프레임. 글자가 섞인 열은 그대로."""
+    out = df.copy(deep=False)
+    for col in df.columns:
+        series = df[col]
+        if not (pd.api.types.is_object_dtype(series) or pd.api.types.is_string_dtype(series)):
+            continue
+        text = series.astype("string").str.strip().str.replace(r"[,%\s]", "", regex=True)
+        text = text.mask(text.isin(PLACEHOLDERS) | (text == ""))
+        numbers = pd.to_numeric(text, errors="coerce")
+        if numbers.notna().sum() == text.notna().sum():        # 숫자가 아닌 값이 없을 때만
+            out[col] = numbers.astype("float64")
+    return out
+
+
+def year_columns(df):
+    """열 이름이 연도(네 자리 숫자)인 열 목록."""
+    names = pd.Index(df.columns.astype(str).str.strip())
+    return list(df.columns[names.str.match(YEAR_PATTERN)])
+
+
+def years_to_rows(df, year_name="연도"):
+    """
+    연도가 열로 펼쳐진 표를 연도가 행이 되도록 뒤집습니다.
+    첫 번째 열은 항목 이름(예: 생산가능인구)으로, 뒤집은 뒤 열 이름이 됩니다.
+    연도 열이 절반도 안 되면 그대로 돌려줍니다.
+    """
+    years = year_columns(df)
+    if len(years) * 2 < len(df.columns):
+        return df
+    label_col = df.columns[0]
+    values = df[years].to_numpy(dtype="float64")
+    out = pd.DataFrame(
+        values.T,
+        columns=df[label_col].astype(str).str.strip().to_numpy(),
+    )
+    out.insert(0, year_name, np.array([int(str(y).strip()) for y in years]))
+    out.columns.name = None
+    return out
+
+
+def normalize_kosis(df, year_name="연도"):
+    """
+    to_numbers → years_to_rows → dtype 줄이기를 한 번에.
+    로더가 이미 줄인 프레임이므로, 연도를 뒤집어 새 표가 생겼을 때만 다시 줄입니다.
+    """
+    numbers = to_numbers(df)
+    out = years_to_rows(numbers, year_name)
+    if out is numbers:
+        return numbers
+    compacted = compact_frame(out)
+    compacted.attrs.update(df.attrs)
+    return compacted
+
+
+@st.cache_resource(show_spinner=False, max_entries=16)
+def _cached_kosis(path, mtime_ns, size, year_name):
+    return normalize_kosis(load_csv(path, **READ_OPTIONS), year_name)
+
+
+@span("load")
+def read_kosis(name, year_name="연도"):
+    """
+    KOSIS CSV 를 정리된 프레임(의 뷰)으로 돌려줍니다.
+    번들 파일이 없으면 utils.data.read_csv 처럼 업로드를 받습니다.
+    """
+    if available(name):
+        return view(tracked(name, _cached_kosis, year_name))
+    return normalize_kosis(read_csv(name, **READ_OPTIONS), year_name)
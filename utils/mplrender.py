@@ -0,0 +1,131 @@
+# utils/mplrender.py
+"""
+matplotlib 차트를 이미지(PNG · SVG) 바이트로 캐시
+
+st.pyplot 은 rerun 마다 그림을 새로 그리고 다시 래스터화합니다.
+여기서는 (데이터 내용 해시, 차트 id, 테마, DPI, 형식) 이 같으면 한 번 만든
+이미지 바이트를 그대로 보냅니다. 저장소는 figcache 의 LRU 를 함께 씁니다.
+
+- 한글 폰트는 프로세스마다 한 번만 `font_manager.addfont` 로 등록
+- pyplot 을 거치지 않고 `matplotlib.figure.Figure` 를 직접 만들어,
+  전역 figure 목록에 남지 않게 함 (오래 도는 서버에서 메모리 누수 방지)
+- rcParams 는 전역으로 바꾸지 않고 그릴 때만 `rc_context` 로 적용
+- matplotlib 은 무거우므로 처음 그릴 때(함수 안에서) 불러옴
+"""
+import contextlib
+import io
+import threading
+import types
+
+import streamlit as st
+
+from utils.data import data_path
+from utils.figcache import figure_cache, figure_key
+from utils.profiling import span
+
+FONT_FILE = "NanumGothic.ttf"
+DEFAULT_DPI = 110
+
+_local = threading.local()          # 예열 스레드의 테마 지정 (theme_override)
+
+# 다크 테마일 때 글자·축 색 (배경은 투명으로 두어 페이지 배경을 따름)
+THEME_RC = {
+    "light": {},
+    "dark": {
+        "text.color": "#FAFAFA",
+        "axes.labelcolor": "#FAFAFA",
+        "axes.edgecolor": "#A3A8B8",
+        "xtick.color": "#FAFAFA",
+        "ytick.color": "#FAFAFA",
+    },
+}
+
+
+@st.cache_resource(show_spinner=False)
+def korean_font():
+    """
+    NanumGothic 을 한 번만 등록하고 글꼴 이름을 돌려줍니다.
+    폰트 파일이 없으면 이미 설치된 Nanum 계열 글꼴을 찾고, 그것도 없으면 None.
+    """
+    from matplotlib import font_manager
+
+    path = data_path(FONT_FILE)
+    if path.exists():
+        font_manager.fontManager.addfont(str(path))
+        return font_manager.FontProperties(fname=str(path)).get_name()
+    for entry in font_manager.fontManager.ttflist:
+        if entry.name.startswith("Nanum"):
+            return entry.name
+    return None
+
+
+def current_theme():
+    """브라우저 테마("light" / "dark"). 알 수 없으면 "light". (예열 스레드는 theme_override 값)"""
+    theme = getattr(_local, "theme", None)
+    if theme is None:
+        try:
+            theme = st.context.theme.type
+        except AttributeError:
+            theme = None
+    return theme if theme in THEME_RC else "light"
+
+
+@contextlib.contextmanager
+def theme_override(theme):
+    """
+    이 스레드에서 current_theme() 가 theme 을 돌려주게 합니다. (세션 없는 예열 스레드용)
+    블록 안에서 테마별 이미지를 하나라도 만들었는지 `.used` 에 남깁니다.
+    """
+    state = types.SimpleNamespace(used=False)
+    previous = getattr(_local, "theme", None), getattr(_local, "state", None)
+    _local.theme, _local.state = theme, state
+    try:
+        yield state
+    finally:
+        _local.theme, _local.state = previous
+
+
+def _rc(theme):
+    rc = {"axes.unicode_minus": False, "svg.fonttype": "none"}   # 음수 부호 깨짐 방지
+    family = korean_font()
+    if family:
+        rc["font.family"] = family
+    rc.update(THEME_RC[theme])
+    return rc
+
+
+def render_image(draw, fmt="png", dpi=DEFAULT_DPI, theme="light", figsize=(12, 5), **params):
+    """draw(fig, **params) 로 그린 차트를 이미지 바이트로 만듭니다."""
+    import matplotlib
+    from matplotlib.figure import Figure
+
+    with matplotlib.rc_context(_rc(theme)):
+        fig = Figure(figsize=figsize)
+        draw(fig, **params)
+        buffer = io.BytesIO()
+        fig.savefig(buffer, format=fmt, dpi=dpi, bbox_inches="tight", transparent=theme == "dark")
+    return buffer.getvalue()
+
+
+@span("figure")
+def cached_image(chart_id, datasets, draw, fmt="png", dpi=DEFAULT_DPI, figsize=(12, 5), **params):
+    """
+    render_image 결과를 캐시해 돌려줍니다. (st.image 에 그대로 넘기면 됨)
+
+    chart_id · datasets · params 는 figcache.cached_figure 와 같은 뜻입니다.
+    데이터 해시를 구할 수 없으면(업로드 등) 캐시하지 않습니다.
+    """
+    theme = current_theme()
+    state = getattr(_local, "state", None)
+    if state is not None:
+        state.used = True
+    render = dict(fmt=fmt, dpi=dpi, theme=theme, figsize=figsize)
+    key = figure_key(chart_id, datasets, draw, dict(params, _render=render))
+    if key is None:
+        return render_image(draw, **render, **params)
+    cache = figure_cache()
+    image = cache.get(key)
+    if image is None:
+        image = render_image(draw, **render, **params)
+        cache.put(key, image, len(image))
+    return image
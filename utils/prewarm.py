@@ -0,0 +1,125 @@
+# utils/prewarm.py
+"""
+서버 시작 시 캐시 미리 채우기
+
+첫 학생이 각 주제 페이지를 열 때 CSV 파싱 · 변환 · 차트 생성을 모두 떠안지 않도록,
+main.py 가 열릴 때 백그라운드 스레드에서 페이지 스크립트를 하나씩 "화면 없이" 실행합니다.
+
+- 세션(ScriptRunContext)이 없는 스레드에서는 st.* 출력이 무시되고,
+  위젯은 기본값을 돌려주므로 → 페이지의 기본 화면과 같은 데이터 · 차트가 캐시에 쌓입니다.
+- 데이터 로더 · 차트 빌더를 페이지가 쓰는 그대로 실행하므로 캐시 키(read_csv 옵션,
+  빌더 코드 해시, 위젯 값)가 실제 방문과 정확히 같습니다.
+- 세션이 없어 브라우저 테마를 알 수 없으므로, 먼저 라이트 테마로 모든 페이지를 돌고
+  테마에 따라 달라지는 matplotlib 이미지(utils/mplrender.py)를 그린 페이지만 다크 테마로 한 번 더 돕니다.
+  (Plotly · Altair 차트는 브라우저가 테마를 입히므로 한 번이면 됨)
+- 프로세스당 한 번만 시작하고(캐시를 지워도 다시 뜨지 않음), 호출한 요청은 기다리지 않습니다.
+- 환경변수 `SDGS_PREWARM=0` 이면 끕니다.
+"""
+import logging
+import os
+import runpy
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import streamlit as st
+
+# utils.data 를 불러오면 pandas 까지 따라오므로, 첫 화면(main.py)에서는 경로만 직접 계산
+PAGES_DIR = Path(__file__).resolve().parent.parent / "pages"
+THREAD_NAME = "sdgs-prewarm"
+
+_start_lock = threading.Lock()
+_prewarm_checked = False
+_status = None                      # 진행 중 · 끝난 예열 (없으면 None)
+
+
+@dataclass
+class PrewarmStatus:
+    """진행 상황 (백그라운드 스레드가 갱신, 페이지는 읽기만)."""
+    pages: list
+    done: list = field(default_factory=list)
+    errors: dict = field(default_factory=dict)
+    current: str = None
+    started: float = field(default_factory=time.perf_counter)
+    elapsed: float = None
+
+    @property
+    def total(self):
+        return len(self.pages)
+
+    @property
+    def finished(self):
+        return self.elapsed is not None
+
+
+def _quiet_missing_context():
+    # 세션 없는 스레드라는 경고가 페이지마다 수십 번 찍히지 않도록 이 스레드 것만 거름
+    logger = logging.getLogger("streamlit.runtime.scriptrunner_utils.script_run_context")
+    logger.addFilter(lambda record: record.threadName != THREAD_NAME)
+
+
+def _run_page(page, theme, status):
+    # 페이지가 테마별 이미지를 그렸으면 True
+    from utils.mplrender import theme_override
+
+    with theme_override(theme) as themed:
+        try:
+            runpy.run_path(str(page), run_name="__main__")
+        except Exception as exc:            # st.stop() 등 — 그 앞까지 채운 캐시는 남음
+            status.errors.setdefault(page.stem, f"{type(exc).__name__}: {exc}")
+    return themed.used
+
+
+def _run(status):
+    themed = []
+    for page in status.pages:
+        status.current = page.stem
+        if _run_page(page, "light", status):
+            themed.append(page)
+        status.done.append(page.stem)
+    for page in themed:                     # 다크 테마 이미지 (진행 막대는 이미 다 찬 상태)
+        status.current = f"{page.stem} (dark)"
+        _run_page(page, "dark", status)
+    status.current = None
+    status.elapsed = time.perf_counter() - status.started
+
+
+def start_prewarm():
+    """
+    백그라운드 예열을 (프로세스당 한 번) 시작하고 진행 상황을 돌려줍니다. 꺼져 있으면 None.
+    st.cache_resource 는 "Clear caches" 로 지워져 스레드가 또 뜨므로, 모듈 변수로 기억합니다.
+    """
+    global _status, _prewarm_checked
+    with _start_lock:
+        if not _prewarm_checked:
+            _prewarm_checked = True
+            if os.environ.get("SDGS_PREWARM", "1") != "0":
+                _status = PrewarmStatus(pages=sorted(PAGES_DIR.glob("*.py")))
+                _quiet_missing_context()
+                threading.Thread(target=_run, args=(_status,), name=THREAD_NAME, daemon=True).start()
+        return _status
+
+
+def show_progress(status):
+    """예열 진행 상황을 작게 표시합니다. 끝날 때까지 1초마다 이 부분만 다시 그림."""
+    if status is None:
+        return
+
+    running = not status.finished
+
+    @st.fragment(run_every=1 if running else None)
+    def _progress():
+        if status.finished:
+            if running:                     # 전체를 한 번 다시 그려 주기적 갱신을 멈춤
+                st.rerun()
+            st.caption(f"✅ 모든 페이지의 데이터와 차트를 미리 준비했습니다. ({status.elapsed:.1f}초)")
+            if status.errors:
+                st.caption("⚠️ 준비하지 못한 페이지: " + ", ".join(status.errors))
+            return
+        label = f"⏳ 페이지 미리 준비 중… {len(status.done)}/{status.total}"
+        if status.current:
+            label += f" ({status.current})"
+        st.progress(len(status.done) / status.total, text=label)
+
+    _progress()
@@ -0,0 +1,261 @@
+# utils/profiling.py
+"""
+rerun 단위 성능 측정 (개발자용)
+
+수업 중 페이지가 느릴 때 시간이 어디서 쓰이는지 — 데이터 읽기(load), 변환(transform),
+차트 생성(figure), 화면 전송(render) — 를 나눠 봅니다.
+
+- 공용 도구(load_csv · tidy_view · cached_figure …)에 `@span(종류)` 를 붙여 두었으므로
+  페이지는 본문을 `with page_profiler():` 로 감싸기만 하면 됩니다. (이름은 페이지 파일 이름)
+  st.stop() · 오류로 끝난 rerun 도 로그에 남습니다. (끝낸 예외 이름이 "ended" 에)
+- render 는 st.plotly_chart 등 차트 요소 호출 시간(직렬화 포함)으로, 측정이 켜진 rerun 에서만 잽니다.
+- 켜는 법: 주소 뒤에 `?debug=1` (cProfile 까지: `?profile=1`), 또는 환경변수 `SDGS_DEBUG=1`
+- 결과는 사이드바 패널에 보이고, JSONL 로그(`SDGS_PROFILE_LOG`, 기본 .cache/profile.jsonl)에 한 줄씩 쌓입니다.
+
+꺼져 있으면 span 은 스레드 지역 변수 하나만 확인하고 지나갑니다.
+"""
+import cProfile
+import functools
+import io
+import json
+import os
+import pstats
+import sys
+import threading
+import time
+from pathlib import Path
+
+import streamlit as st
+
+LOG_PATH = Path(os.environ.get(
+    "SDGS_PROFILE_LOG",
+    Path(__file__).resolve().parent.parent / ".cache" / "profile.jsonl",
+))
+KINDS = ("load", "transform", "figure", "render")
+RENDER_METHODS = ("plotly_chart", "altair_chart", "pydeck_chart", "image",
+                  "dataframe", "line_chart", "bar_chart")
+
+_local = threading.local()          # 스크립트 스레드별 현재 측정기
+_log_lock = threading.Lock()
+_hooks_lock = threading.Lock()
+_hooks_installed = False
+RENDER_HOOK = "_sdgs_render_hook"   # render span 으로 감싼 메서드 표시
+
+
+class RunProfile:
+    """한 번의 rerun 동안 span 을 모읍니다."""
+
+    def __init__(self, page, with_cprofile=False):
+        self.page = page
+        self.spans = []             # (이름, 종류, 깊이, 시작 ms, 걸린 ms, 자식 ms)
+        self._stack = []
+        self.started = time.perf_counter()
+        self.profiler = cProfile.Profile() if with_cprofile else None
+        if self.profiler:
+            try:
+                self.profiler.enable()
+            except ValueError:      # 다른 세션이 이미 cProfile 을 쓰는 중 (3.12+)
+                self.profiler = None
+
+    def _now_ms(self):
+        return (time.perf_counter() - self.started) * 1000
+
+    def open(self, name, kind):
+        self._stack.append([name, kind, len(self._stack), self._now_ms(), 0.0])
+
+    def close(self):
+        name, kind, depth, start, child_ms = self._stack.pop()
+        elapsed = self._now_ms() - start
+        if self._stack:
+            self._stack[-1][4] += elapsed
+        self.spans.append((name, kind, depth, start, elapsed, child_ms))
+
+    def totals(self):
+        """종류별 자기 시간(self time, 자식 span 제외) ms."""
+        totals = dict.fromkeys(KINDS, 0.0)
+        for _, kind, _, _, elapsed, child_ms in self.spans:
+            totals[kind] = totals.get(kind, 0.0) + elapsed - child_ms
+        return {kind: round(ms, 2) for kind, ms in totals.items()}
+
+    def cprofile_text(self, limit=25):
+        if not self.profiler:
+            return None
+        out = io.StringIO()
+        pstats.Stats(self.profiler, stream=out).sort_stats("cumulative").print_stats(limit)
+        return out.getvalue()
+
+    def record(self):
+        return {
+            "time": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "page": self.page,
+            "run_ms": round(self._now_ms(), 2),
+            "totals": self.totals(),
+            "spans": [
+                {"name": name, "kind": kind, "depth": depth,
+                 "start_ms": round(start, 2), "ms": round(elapsed, 2)}
+                for name, kind, depth, start, elapsed, _ in sorted(self.spans, key=lambda s: s[3])
+            ],
+        }
+
+
+def _current():
+    return getattr(_local, "profile", None)
+
+
+def span(kind, name=None):
+    """함수 호출을 span 으로 잽니다. 측정이 꺼진 rerun 에서는 그대로 호출만 함."""
+    def decorate(func):
+        label = name or func.__name__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            profile = _current()
+            if profile is None:
+                return func(*args, **kwargs)
+            profile.open(label, kind)
+            try:
+                return func(*args, **kwargs)
+            finally:
+                profile.close()
+        return wrapper
+    return decorate
+
+
+def _install_render_hooks():
+    # 차트 요소 호출을 render span 으로 감쌈 (처음 측정을 켤 때 프로세스당 한 번만)
+    # st.plotly_chart 등은 import 때 묶인 메서드라 클래스와 st 모듈 양쪽을 감쌈
+    # st.cache_resource 는 "Clear caches" 로 지워지므로 실행 여부는 모듈 변수로 기억
+    # (Streamlit 메서드도 __wrapped__ 를 가지므로, 이미 감쌌는지는 RENDER_HOOK 표시로 확인)
+    global _hooks_installed
+    with _hooks_lock:
+        if _hooks_installed:
+            return
+        from streamlit.delta_generator import DeltaGenerator
+
+        for method in RENDER_METHODS:
+            for owner in (DeltaGenerator, st):
+                original = getattr(owner, method)
+                if getattr(original, RENDER_HOOK, False):
+                    continue
+                hooked = span("render", method)(original)
+                setattr(hooked, RENDER_HOOK, True)
+                setattr(owner, method, hooked)
+        _hooks_installed = True
+
+
+def enabled():
+    if os.environ.get("SDGS_DEBUG") == "1":
+        return True
+    params = st.query_params
+    return params.get("debug") == "1" or params.get("profile") == "1"
+
+
+class PageProfiler:
+    """
+    page_profiler() 가 돌려주는 핸들. 페이지 본문을 `with page_profiler():` 로 감쌉니다.
+    정상 종료면 기록하고 패널을 보여 주며, st.stop() · rerun · 오류로 끝나도 측정을 끄고 기록은 남깁니다.
+    """
+
+    def __init__(self, profile):
+        self.profile = profile
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        # 예외로 끝난 rerun 에서는 화면에 더 그릴 수 없으므로(st.stop() 뒤 등) 로그만 남김
+        self.finish(ended=None if exc_type is None else exc_type.__name__)
+        return False
+
+    def close(self):
+        """기록하지 않고 측정을 끝냅니다. 여러 번 불러도 됨."""
+        profile, self.profile = self.profile, None
+        if profile is not None:
+            _stop(profile)
+        return profile
+
+    def finish(self, ended=None):
+        """측정을 끝내고 로그에 남깁니다. ended(끝낸 예외 이름)가 없을 때만 패널을 보여 줌."""
+        profile = self.close()
+        if profile is None:
+            return
+        record = profile.record()
+        if ended:
+            record["ended"] = ended
+        _append_log(record)
+        if not ended:
+            _show_panel(record, profile.cprofile_text())
+
+
+def _stop(profile):
+    if profile.profiler:
+        profile.profiler.disable()
+    if _current() is profile:
+        _local.profile = None
+
+
+def page_profiler(page=None):
+    """
+    이 rerun 의 측정을 시작합니다. (꺼져 있으면 아무것도 하지 않는 핸들)
+    page 를 생략하면 부른 스크립트의 파일 이름(확장자 제외)을 씁니다.
+    """
+    leftover = _current()
+    if leftover is not None:
+        # 지난 rerun 이 측정을 끝내지 못함 (with 밖에서 오류 등) → cProfile 도 꺼 둠
+        _stop(leftover)
+    if not enabled():
+        return PageProfiler(None)
+    if page is None:
+        page = Path(sys._getframe(1).f_globals.get("__file__", "?")).stem
+    _install_render_hooks()
+    profile = RunProfile(page, with_cprofile=st.query_params.get("profile") == "1")
+    _local.profile = profile
+    return PageProfiler(profile)
+
+
+def _append_log(record):
+    try:
+        LOG_PATH.parent.mkdir(parents=True, exist_ok=True)
+        line = json.dumps(record, ensure_ascii=False)
+        with _log_lock, open(LOG_PATH, "a", encoding="utf-8") as f:
+            f.write(line + "\n")
+    except OSError:
+        pass                        # 읽기 전용 배포 환경 등 — 패널만 보여 줌
+
+
+def _show_panel(record, cprofile_text):
+    import pandas as pd
+
+    with st.sidebar.expander("⏱️ 성능 디버그", expanded=True):
+        st.metric("이번 rerun", f"{record['run_ms']:.0f} ms")
+        totals = record["totals"]
+        st.caption(" · ".join(f"{kind} {totals[kind]:.0f}ms" for kind in KINDS))
+        spans = pd.DataFrame(record["spans"])
+        if not spans.empty:
+            spans["name"] = ["  " * d + n for d, n in zip(spans["depth"], spans["name"])]
+            st.dataframe(spans[["name", "kind", "ms"]], hide_index=True, use_container_width=True)
+        if cprofile_text:
+            st.code(cprofile_text, language=None)
+        _show_memory()
+        st.caption(f"로그: {LOG_PATH}")
+
+
+def _show_memory():
+    # 불러온 표들의 dtype 줄이기 결과 (utils/compact.py)
+    import pandas as pd
+
+    from utils.compact import memory_report
+
+    report = pd.DataFrame(memory_report(), columns=["표", "before", "after"])
+    if report.empty:
+        return
+    st.caption("불러온 표의 메모리 (dtype 줄이기 전 → 후)")
+    st.dataframe(
+        pd.DataFrame({
+            "표": report["표"],
+            "전 KB": (report["before"] / 1024).round(1),
+            "후 KB": (report["after"] / 1024).round(1),
+            "절약 %": (100 * (1 - report["after"] / report["before"])).round(0),
+        }),
+        hide_index=True, use_container_width=True,
+    )
@@ -0,0 +1,155 @@
+# utils/sealevel.py
+"""
+해수면 관측소 저장소 (+ 위성 관측 전 지구 평균 해수면 시계열)
+
+sealevel_data_download.csv (관측소 × 연도 wide 표)를
+- 관측소 정보 표 (meta)
+- float32 `관측소 × 연도` 행렬 + 결측(NaN) 마스크
+- 관측소 id · 표시 이름 → 행 번호 해시 색인
+으로 한 번만 바꿔 두고, 상세 · 평균 · 순위를 모두 이 행렬에서 계산합니다.
+위젯을 조작할 때마다 DataFrame 을 훑지 않습니다.
+"""
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from utils.data import load_csv, tracked
+from utils.profiling import span
+from utils.shared import view
+from utils.trends import fit_trends
+
+SEALEVEL_FILE = "sealevel_data_download.csv"
+GMSL_FILE = "sealevel.csv"
+CYCLE_DAYS = 9.9156     # 위성 고도계(TOPEX/Jason) 반복 주기 ≈ 연 37회 관측
+MIN_COVERAGE = 0.5      # 추세를 계산할 최소 관측 비율 (전체 연도 중)
+META_COLS = ["id", "location", "country", "continent", "latitude", "longitude"]
+
+
+@dataclass(frozen=True)
+class StationStore:
+    # 프레임 · 배열은 모든 세션이 공유: 프레임은 뷰로만 내주고, 배열은 쓰기 금지
+    _meta: pd.DataFrame         # 관측소 정보 (행 순서 = 행렬 행 순서), label 열 포함
+    years: np.ndarray           # (연도 수,) int
+    levels: np.ndarray          # (관측소 수, 연도 수) float32, 결측은 NaN
+    valid: np.ndarray           # levels 와 같은 모양의 bool (관측값 있음)
+    index: dict                 # 관측소 id · label → 행 번호
+    labels: list                # 선택 상자용 label 목록 (가나다/알파벳 순)
+    _yearly_mean: pd.DataFrame  # [Year, Avg_Sea_Level] 연도별 전체 평균
+
+    @property
+    def meta(self):
+        return view(self._meta)
+
+    @property
+    def yearly_mean(self):
+        return view(self._yearly_mean)
+
+    def row(self, key):
+        """관측소 id 또는 label → 행 번호."""
+        return self.index[key]
+
+    def col(self, year):
+        """연도 → 열 번호."""
+        return int(np.searchsorted(self.years, int(year)))
+
+    def station(self, key):
+        """관측소 정보 한 줄 (Series)."""
+        return self._meta.iloc[self.row(key)]
+
+    def value(self, key, year):
+        """관측소 · 연도 한 칸 값 (없으면 NaN)."""
+        return self.levels[self.row(key), self.col(year)]
+
+    def series(self, key):
+        """관측소 하나의 연도별 시계열 [Year, Sea_Level]."""
+        return pd.DataFrame({"Year": self.years, "Sea_Level": self.levels[self.row(key)]})
+
+    def change(self, start, end):
+        """모든 관측소의 end - start 변화량 (둘 중 하나라도 없으면 NaN)."""
+        return self.levels[:, self.col(end)] - self.levels[:, self.col(start)]
+
+
+def build_station_store(df):
+    """wide 프레임 → StationStore. (캐시 없음)"""
+    year_cols = [c for c in df.columns if str(c).isnumeric()]
+    years = np.array([int(c) for c in year_cols])
+    order = np.argsort(years, kind="stable")
+    years = years[order]
+    levels = np.ascontiguousarray(df[year_cols].to_numpy(dtype="float32")[:, order])
+    valid = ~np.isnan(levels)
+
+    meta = df[META_COLS].reset_index(drop=True)
+    label = meta["location"].astype(str) + " (" + meta["country"].astype(str) + ")"
+    # 같은 이름의 관측소가 있으면 id 를 붙여 구분
+    dup = label.duplicated(keep=False)
+    label[dup] = label[dup] + " #" + meta.loc[dup, "id"].astype(str)
+    meta["label"] = label
+
+    index = {key: i for i, key in enumerate(meta["id"])}
+    index.update({key: i for i, key in enumerate(meta["label"])})
+
+    # 연도별 평균 (관측값이 있는 관측소만)
+    counts = valid.sum(axis=0)
+    sums = np.where(valid, levels, 0).sum(axis=0, dtype="float64")
+    with np.errstate(invalid="ignore", divide="ignore"):
+        means = np.where(counts > 0, sums / counts, np.nan)
+    yearly_mean = pd.DataFrame({"Year": years, "Avg_Sea_Level": means})
+
+    for array in (years, levels, valid):
+        array.flags.writeable = False
+    return StationStore(
+        _meta=meta, years=years, levels=levels, valid=valid, index=index,
+        labels=sorted(meta["label"]), _yearly_mean=yearly_mean,
+    )
+
+
+@st.cache_resource(show_spinner=False)
+def _cached_store(path, mtime_ns, size):
+    return build_station_store(load_csv(path))
+
+
+@span("transform")
+def station_store(name=SEALEVEL_FILE):
+    """해수면 관측소 저장소 (모든 세션 공유)."""
+    return tracked(name, _cached_store)
+
+
+@st.cache_resource(show_spinner=False)
+def _cached_trends(path, mtime_ns, size, min_coverage):
+    store = tracked(path, _cached_store)
+    stations = fit_trends(store.years, store.levels, store.valid, min_coverage)
+    stations = pd.concat([store.meta, stations], axis=1)
+    mean = store.yearly_mean["Avg_Sea_Level"].to_numpy()[None, :]
+    overall = fit_trends(store.years, mean, min_coverage=min_coverage).iloc[0]
+    return stations, overall
+
+
+@span("transform")
+def station_trends(name=SEALEVEL_FILE, min_coverage=MIN_COVERAGE):
+    """
+    관측소별 추세 (mm/년, 95% 신뢰구간). 행 순서는 store.meta 와 같습니다.
+    관측 비율이 min_coverage 미만인 관측소는 slope 가 NaN.
+    """
+    return view(tracked(name, _cached_trends, min_coverage)[0])
+
+
+@span("transform")
+def global_trend(name=SEALEVEL_FILE, min_coverage=MIN_COVERAGE):
+    """연도별 전체 평균 해수면의 추세 (Series: slope, ci_low, ci_high, intercept …)."""
+    return view(tracked(name, _cached_trends, min_coverage)[1])
+
+
+@st.cache_resource(show_spinner=False)
+def _cached_gmsl(path, mtime_ns, size):
+    df = load_csv(path)
+    # 같은 해 안의 관측 순서로 소수 연도(Time) 만들기
+    time = df["Year"] + df.groupby("Year").cumcount() * CYCLE_DAYS / 365.25
+    return df.assign(Time=time)[["Time", "GMSL_GIA", "SmoothedGSML_GIA", "StdDevGMSL_GIA"]]
+
+
+@span("transform")
+def gmsl_series(name=GMSL_FILE):
+    """위성 관측 전 지구 평균 해수면 (약 10일 간격) [Time, GMSL_GIA, SmoothedGSML_GIA, …]."""
+    return view(tracked(name, _cached_gmsl))
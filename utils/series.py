@@ -0,0 +1,35 @@
+# utils/series.py
+"""
+계열(선) 켜고 끄기를 브라우저에서
+
+도시 · 연령대 · 에너지원 · 지표를 multiselect 로 고르면 고를 때마다 스크립트 전체가 다시 실행되고,
+고른 조합마다 새 차트를 만들어 다시 보냅니다. 대신 모든 계열을 담은 차트 하나를 (데이터 버전마다 한 번)
+만들어 두고, 처음에 보일 계열만 켜 둡니다. 나머지는 범례에 남아 있어 학생이 눌러서 켭니다.
+
+- 범례 한 번 클릭: 켜기/끄기, 두 번 클릭: 그 계열만 보기 (Plotly 기본 동작)
+- "모두 보기" · "모두 숨기기" 버튼(updatemenus)
+- 차트 spec 이 위젯 값과 무관하므로 figcache 에 한 항목만 생기고, 계열을 바꿔도 서버 작업 · 전송이 없음
+"""
+
+SHOW_ALL = "모두 보기"
+HIDE_ALL = "모두 숨기기"
+HINT = "범례를 눌러 계열을 켜고 끕니다. (두 번 누르면 그 계열만 보기)"
+
+
+def legend_toggle(fig, shown):
+    """
+    Plotly 그림의 trace 중 이름이 shown 에 없는 것은 범례에만 두고(legendonly),
+    모두 보기 / 모두 숨기기 버튼을 붙입니다. 그림을 그대로 돌려줍니다. (build 함수 안에서 호출)
+    """
+    shown = set(shown)
+    for trace in fig.data:
+        trace.visible = True if trace.name in shown else "legendonly"
+    fig.update_layout(updatemenus=[dict(
+        type="buttons", direction="right", showactive=False,
+        x=1, xanchor="right", y=1.02, yanchor="bottom",
+        buttons=[
+            dict(label=SHOW_ALL, method="restyle", args=[{"visible": True}]),
+            dict(label=HIDE_ALL, method="restyle", args=[{"visible": "legendonly"}]),
+        ],
+    )])
+    return fig
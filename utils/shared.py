@@ -0,0 +1,20 @@
+# utils/shared.py
+"""
+세션끼리 함께 쓰는 읽기 전용 데이터
+
+캐시(st.cache_resource)에 든 프레임은 프로세스에 하나뿐이고, 모든 세션이 같은 메모리를 씁니다.
+그래서 메모리는 세션 수가 아니라 데이터 개수에 비례합니다. 다만 누군가 그 프레임을 고치면
+다른 학생 화면까지 바뀌므로, 밖으로 내줄 때는 항상 `view()` 를 거칩니다.
+
+- pandas Copy-on-Write 가 켜져 있다고 가정합니다. (utils/bootstrap.py, pandas 3 의 기본 동작)
+  → `to_numpy()` 등으로 꺼낸 배열은 쓰기 금지(read-only)이고,
+    뷰에서 값을 바꾸면 바뀐 열만 그 자리에서 복사됩니다.
+- `view(df)` 는 데이터를 복사하지 않는 새 DataFrame 객체(얕은 복사)입니다.
+  `df["새 열"] = ...` 이나 `df.columns = ...` 는 그 뷰에만 적용되어 자기 세션의 파생 열이 되고,
+  공유 원본은 그대로 남습니다.
+"""
+
+
+def view(obj):
+    """공유 DataFrame · Series → 복사 없는 전용 뷰."""
+    return obj.copy(deep=False)
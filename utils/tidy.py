@@ -0,0 +1,137 @@
+# utils/tidy.py
+"""
+wide ↔ long(tidy) 데이터 캐시
+
+여러 페이지가 rerun 마다 `DataFrame.melt` 를 다시 돌리던 것을 대신합니다.
+파일마다 한 번만 wide 프레임과 long 프레임을 만들어 두고,
+id(연도·지역 등)별 / 변수(월·연령대·에너지원 등)별 조각을 dict 로 미리 나눠 둡니다.
+위젯 조작은 이 dict 를 찾아보기만 하면 됩니다.
+"""
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from utils.data import available, load_csv, read_csv, tracked
+from utils.profiling import span
+from utils.shared import view
+
+
+@dataclass(frozen=True)
+class TidyView:
+    # 프레임은 모든 세션이 공유하므로 밑줄 필드에 두고, 밖으로는 뷰(utils/shared.py)만 내줌
+    _wide: pd.DataFrame     # 열 이름 정리 · id 형변환까지 마친 wide 프레임
+    _long: pd.DataFrame     # [id_col, var_name, value_name], id(원본 행 순) → 변수(열 순) 정렬
+    id_col: str
+    var_name: str
+    value_name: str
+    _by_id: dict            # id 값 → 해당 행들의 long 조각
+    _by_var: dict           # 변수 이름 → 해당 변수의 long 조각
+
+    @property
+    def wide(self):
+        return view(self._wide)
+
+    @property
+    def long(self):
+        return view(self._long)
+
+    @property
+    def ids(self):
+        return list(self._by_id)
+
+    @property
+    def variables(self):
+        """원본 wide 의 열 순서 그대로의 변수 목록."""
+        return list(self._by_var)
+
+    def at(self, id_value):
+        """id 하나의 long 조각. 없으면 빈 프레임. (슬라이더용)"""
+        return view(self._by_id.get(id_value, self._long.iloc[:0]))
+
+    def for_ids(self, ids):
+        """여러 id 의 long 조각을 합칩니다. (멀티셀렉트용)"""
+        parts = [self._by_id[i] for i in ids if i in self._by_id]
+        return pd.concat(parts) if parts else self.long.iloc[:0]
+
+    def for_vars(self, variables):
+        """여러 변수의 long 조각을 합칩니다. (멀티셀렉트용)"""
+        parts = [self._by_var[v] for v in variables if v in self._by_var]
+        return pd.concat(parts) if parts else self.long.iloc[:0]
+
+
+def build_tidy_view(wide, var_name, value_name, id_col=None, id_name=None, id_dtype=None):
+    """
+    wide 프레임으로 TidyView 를 만듭니다. (캐시 없음)
+
+    id_col   : id 로 쓸 열 (기본값: 첫 번째 열)
+    id_name  : id 열의 새 이름 (예: 첫 열 → "지역")
+    id_dtype : id 열 형변환 (예: int)
+    """
+    wide = view(wide)
+    wide.columns = wide.columns.str.strip()
+    id_col = id_col or wide.columns[0]
+    if id_name and id_name != id_col:
+        wide = wide.rename(columns={id_col: id_name})
+        id_col = id_name
+    if id_dtype is not None:
+        wide[id_col] = wide[id_col].astype(id_dtype)
+
+    value_cols = [c for c in wide.columns if c != id_col]
+    long = wide.melt(id_vars=id_col, var_name=var_name, value_name=value_name)
+    # 변수 열은 원본 열 순서를 기억하는 범주형으로
+    long[var_name] = pd.Categorical(long[var_name], categories=value_cols, ordered=True)
+    # melt 결과(변수 우선)를 id 우선 순서로: id 는 원본 행 순서, 그 안에서 변수는 열 순서
+    n_rows, n_vars = len(wide), len(value_cols)
+    order = np.arange(n_rows * n_vars).reshape(n_vars, n_rows).T.ravel()
+    long = long.take(order).reset_index(drop=True)
+
+    by_id = {key: part for key, part in long.groupby(id_col, sort=False, observed=True)}
+    by_var = {key: part for key, part in long.groupby(var_name, sort=True, observed=True)}
+    return TidyView(wide, long, id_col, var_name, value_name, by_id, by_var)
+
+
+@st.cache_resource(show_spinner=False, max_entries=32)
+def _cached_view(path, mtime_ns, size, params, read_kwargs):
+    wide = load_csv(path, **dict(read_kwargs))
+    return build_tidy_view(wide, **dict(params))
+
+
+@span("transform")
+def tidy_view(name, var_name, value_name, id_col=None, id_name=None, id_dtype=None,
+              **read_kwargs):
+    """
+    CSV 파일의 TidyView 를 돌려줍니다. 모든 세션이 같은 객체를 공유합니다.
+    (.wide · .long · .at() 은 뷰이므로 고쳐도 공유 원본은 그대로)
+
+    예) energy = tidy_view("energy.csv", var_name="에너지원", value_name="비율(%)", id_dtype=int)
+        energy.at(2020)               # 2020년 행의 long 조각
+        energy.for_vars(["석탄"])      # 선택한 에너지원만
+    """
+    params = (
+        ("var_name", var_name), ("value_name", value_name),
+        ("id_col", id_col), ("id_name", id_name),
+        ("id_dtype", None if id_dtype is None else str(pd.api.types.pandas_dtype(id_dtype))),
+    )
+    read_kwargs = tuple(sorted(read_kwargs.items()))
+    return tracked(name, _cached_view, params, read_kwargs)
+
+
+@span("transform")
+@st.cache_resource(show_spinner=False, max_entries=8)
+def tidy_view_of_frame(wide, var_name, value_name, id_col=None, id_name=None, id_dtype=None):
+    """업로드 파일처럼 경로가 없는 프레임용. (프레임 내용을 해시해 캐시)"""
+    return build_tidy_view(wide, var_name, value_name, id_col, id_name, id_dtype)
+
+
+@span("transform")
+def read_tidy(name, var_name, value_name, id_col=None, id_name=None, id_dtype=None):
+    """
+    페이지용 도우미 (utils.data.read_csv 의 TidyView 판):
+    번들 파일이 있으면 tidy_view, 없으면 업로드 받은 파일로 만듭니다.
+    """
+    args = dict(id_col=id_col, id_name=id_name, id_dtype=id_dtype)
+    if available(name):
+        return tidy_view(name, var_name, value_name, **args)
+    return tidy_view_of_frame(read_csv(name), var_name, value_name, **args)
@@ -0,0 +1,100 @@
+# utils/watch.py
+"""
+데이터 파일 감시 · 바뀐 파일의 캐시만 지우기
+
+학기 중 선생님이 2025_monthly_fire.csv 같은 파일을 새 버전으로 바꿔 넣으면,
+캐시 키(경로, mtime, 크기)가 달라지므로 다음 rerun 부터는 새 데이터가 쓰입니다.
+다만 예전 버전으로 만든 프레임 · 뷰 · 차트는 메모리에 그대로 남으므로,
+이 감시 스레드가 바뀐 파일에 기대던 항목만 골라 지웁니다. (다른 파일의 캐시는 그대로)
+
+- DATA_DIRS 의 CSV 를 몇 초마다 stat 으로 확인 (추가 패키지 없이 동작)
+- 지우는 대상: utils.data.tracked() 로 기록된 캐시 호출(파싱 · TidyView · 관측소 저장소 …)과
+  그 파일의 옛 내용 해시가 키에 든 차트 · 이미지(figcache)
+- 열려 있는 세션은 다음 rerun(위젯 조작 · 새로고침)에서 새 데이터를 봅니다.
+- 환경변수 `SDGS_WATCH=0` 이면 끄고, `SDGS_WATCH_INTERVAL` 로 확인 간격(초)을 바꿉니다.
+"""
+import logging
+import os
+import threading
+import time
+
+from utils.data import DATA_DIRS, forget
+
+logger = logging.getLogger(__name__)
+
+INTERVAL = float(os.environ.get("SDGS_WATCH_INTERVAL", 2))
+
+_start_lock = threading.Lock()
+_watch_checked = False
+_watcher = None                     # 실행 중인 DataWatcher (꺼져 있으면 None)
+
+
+def snapshot():
+    """감시 중인 CSV → (mtime_ns, 크기)."""
+    files = {}
+    for folder in DATA_DIRS:
+        for path in folder.glob("*.csv"):
+            try:
+                stat = path.stat()
+            except OSError:             # 확인하는 사이에 지워진 경우
+                continue
+            files[str(path.resolve())] = (stat.st_mtime_ns, stat.st_size)
+    return files
+
+
+def invalidate(path):
+    """path 에 기대던 캐시 항목과 차트만 지웁니다. 지운 항목 수를 돌려줍니다."""
+    from utils.figcache import figure_cache
+
+    calls, hashes = forget(path)
+    for cached_func, args in calls:
+        cached_func.clear(*args)
+    figure_cache().discard(lambda key: any(h in key[1] for h in hashes))
+    logger.info("%s 바뀜: 캐시 %d개, 차트 해시 %d개 정리", path, len(calls), len(hashes))
+    return len(calls)
+
+
+class DataWatcher:
+    """DATA_DIRS 를 주기적으로 확인하는 데몬 스레드."""
+
+    def __init__(self, interval=INTERVAL):
+        self.interval = interval
+        self.files = snapshot()
+        self.changes = 0
+        self._thread = threading.Thread(target=self._loop, name="sdgs-watch", daemon=True)
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def poll(self):
+        """한 번 확인하고 바뀌거나 지워진 파일 목록을 돌려줍니다."""
+        current = snapshot()
+        changed = [path for path, stamp in self.files.items() if current.get(path) != stamp]
+        for path in changed:
+            invalidate(path)
+        self.files = current
+        self.changes += len(changed)
+        return changed
+
+    def _loop(self):
+        while True:
+            time.sleep(self.interval)
+            try:
+                self.poll()
+            except Exception:           # 감시가 멈추지 않도록 기록만 하고 계속
+                logger.exception("데이터 파일 감시 중 오류")
+
+
+def start_watcher():
+    """
+    감시 스레드를 (프로세스당 한 번) 시작합니다. 꺼져 있으면 None.
+    st.cache_resource 는 "Clear caches" 로 지워져 스레드가 또 뜨므로, 모듈 변수로 기억합니다.
+    """
+    global _watcher, _watch_checked
+    with _start_lock:
+        if not _watch_checked:
+            _watch_checked = True
+            if os.environ.get("SDGS_WATCH", "1") != "0":
+                _watcher = DataWatcher().start()
+        return _watcher